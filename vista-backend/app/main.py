@@ -14,6 +14,7 @@ from app.middleware import RequestResponseLoggingMiddleware, RequestSizeMiddlewa
 from app.routers import dashboard, deploy, hardware, config
 from app.routers import dnp3, snmp_set, opcua, modbus, iec104, logs, admin
 from app.services.config_monitor import config_monitor
+from app.services.iec104_service import close_iec104_clients
 
 # Initialize comprehensive logging system
 log_manager.setup_all_loggers()
@@ -153,6 +154,8 @@ async def shutdown_event():
     startup_logger.info("   🔧 Performing cleanup operations...")
     
     # Add any cleanup operations here
+    close_iec104_clients()
+    startup_logger.info("   🔌 IEC-104 client connections closed")
     
     startup_logger.info("   ✅ Cleanup completed successfully")
     startup_logger.info("   👋 Application shutdown completed")
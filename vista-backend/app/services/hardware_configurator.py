@@ -143,4 +143,8 @@ def apply_network_configuration(config):
     Applies network configuration changes. Use this when you want to actually change network settings.
     """
     logger.info("🔧 Applying network configuration changes...")
-    configure_hardware(config, apply_network_changes=True)
+    try:
+        configure_hardware(config, apply_network_changes=True)
+    finally:
+        # Addresses and link state just changed; don't serve the cached interface list
+        HardwareDetector.invalidate_cache()
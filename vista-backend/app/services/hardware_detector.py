@@ -8,20 +8,169 @@ import subprocess
 import platform
 import logging
 import glob
-import json
+import time
+import threading
+import select
+import socket
+import errno
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    from pyroute2 import IPRoute
+    PYROUTE2_AVAILABLE = True
+except ImportError:
+    PYROUTE2_AVAILABLE = False
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_PLATFORM = platform.system()
+
+# Precompiled patterns used by the detectors below; lsusb/gpiodetect output is matched as raw bytes
+_LSUSB_RE = re.compile(
+    rb'^Bus (\d+) Device (\d+): ID ([0-9a-fA-F]{4}):([0-9a-fA-F]{4})[ \t]+(.+?)\r?$',
+    re.MULTILINE
+)
+_GPIOCHIP_RE = re.compile(rb'(gpiochip\d+)\s+\[([^\]]+)\]\s+\((\d+)\s+lines\)')
+_DEVNUM_RE = re.compile(r'\d+$')
+# wlan0, wlp3s0, wifi0, ath0 (Atheros), ra0 (Ralink), rtl0 (Realtek)
+_WIFI_RE = re.compile(r'^(wlan\d+|wl\w+|wifi\d+|ath\d+|ra\d+|rtl\d+)$')
+# USB device directories in sysfs: root hubs (usb1) and ports (1-1, 1-1.2); interfaces (1-1:1.0) are skipped
+_USB_SYSFS_DEVICE_RE = re.compile(r'^(usb\d+|\d+-[\d.]+)$')
+_USB_DEVICE_ROOT_RE = re.compile(r'(.*/\d+-[\d.]+)/')
+
+USB_SYSFS_PATH = '/sys/bus/usb/devices'
+GPIO_SYSFS_PATH = '/sys/class/gpio'
+_USB_DEVICE_ATTRS = ('idVendor', 'idProduct', 'manufacturer', 'product', 'busnum', 'devnum')
+_USB_SERIAL_ATTRS = ('idVendor', 'idProduct', 'manufacturer', 'product', 'serial')
+
+# detect_all_hardware sections that change at runtime; the long cache TTL needs a working watch on each
+_HOTPLUG_SECTIONS = frozenset({'serial_ports', 'network_interfaces', 'gpio', 'usb_devices'})
+# /dev nodes (tty, gpiochip) appear and disappear with hardware; sysfs emits no inotify events
+_DEV_WATCH_PATH = '/dev'
+# Netlink constants not exported by the socket module
+_NETLINK_KOBJECT_UEVENT = 15
+_UEVENT_KERNEL_GROUP = 1
+# RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV6_IFADDR: link add/remove/state and address changes
+_RTNL_HOTPLUG_GROUPS = 0x1 | 0x10 | 0x100
+# uevent SUBSYSTEM values and the detect_all_hardware section they change
+_UEVENT_SUBSYSTEM_SECTIONS = {
+    b'tty': 'serial_ports',
+    b'net': 'network_interfaces',
+    b'gpio': 'gpio',
+    b'usb': 'usb_devices',
+}
+
+
+def _uevent_section(message: bytes) -> Optional[str]:
+    """Section of detect_all_hardware a kernel uevent message belongs to, from its SUBSYSTEM field."""
+    for field in message.split(b'\0'):
+        if field.startswith(b'SUBSYSTEM='):
+            return _UEVENT_SUBSYSTEM_SECTIONS.get(field[len(b'SUBSYSTEM='):])
+    return None
+
+
+def _read_small(path: str) -> Optional[str]:
+    """
+    Read a small sysfs attribute file, returning None if it cannot be read.
+
+    Sysfs attributes are short ASCII values, so a single unbuffered os.read
+    avoids the overhead of a text-mode file object.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 256).decode('ascii', 'replace').strip()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _resolve_sysfs_link(path: str) -> str:
+    """
+    Resolve a single sysfs symlink with one readlink call.
+
+    Sysfs links point into the real /sys/devices tree, so unlike os.path.realpath
+    there is no need to stat every path component. Non-symlinks are returned as-is;
+    a missing path raises OSError.
+    """
+    try:
+        target = os.readlink(path)
+    except OSError:
+        if os.path.lexists(path):
+            return path
+        raise
+    return os.path.normpath(os.path.join(os.path.dirname(path), target))
+
+
+def _list_sysfs_gpio_chips() -> Optional[List[str]]:
+    """List gpiochip entries of the legacy sysfs GPIO interface, or None if it is absent."""
+    try:
+        with os.scandir(GPIO_SYSFS_PATH) as entries:
+            return [entry.name for entry in entries if entry.name.startswith('gpiochip')]
+    except OSError:
+        return None
+
+
+def _read_sysfs_attrs(path: str, names) -> Dict[str, str]:
+    """
+    Read several attribute files from one sysfs directory.
+
+    The directory is listed once and only attributes that are present are opened,
+    instead of stat-ing every candidate file individually.
+    """
+    try:
+        with os.scandir(path) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        return {}
+
+    attrs = {}
+    for name in names:
+        if name in present:
+            value = _read_small(os.path.join(path, name))
+            if value is not None:
+                attrs[name] = value
+    return attrs
+
 class HardwareDetector:
     """Class for detecting and monitoring hardware resources."""
 
+    # Short-lived cache for detect_all_hardware; topology changes far less often than it is polled
+    _all_cache: Optional[Dict[str, Any]] = None
+    _all_cache_ts: float = 0.0
+    # Bumped on every invalidation so a scan that raced with a change is not cached
+    _cache_generation = 0
+    _TTL = 3.0
+    # Used only while the hotplug watcher reports changes for every section in _HOTPLUG_SECTIONS,
+    # since the cache is then invalidated on change and the TTL is just a safety net
+    _WATCHED_TTL = 30.0
+    _system_info_cache: Optional[Dict[str, str]] = None
+
+    _watcher_lock = threading.Lock()
+    _watcher_thread: Optional[threading.Thread] = None
+    # Sections the running watcher's sources have delivered events for, so are known to be watched
+    _watched_sections: frozenset = frozenset()
+
     @staticmethod
     def detect_serial_ports() -> List[Dict[str, Any]]:
         """Detect all available serial ports on the system."""
         ports = []
         
-        if platform.system() == 'Linux':
+        if _PLATFORM == 'Linux':
             # Check /dev for common serial port patterns
             dev_dir = '/dev'
             port_patterns = [
@@ -56,15 +205,13 @@ class HardwareDetector:
                         elif 'rfcomm' in port_name:
                             port_type = "Bluetooth Serial"
                         
-                        # Check if port is accessible
-                        is_accessible = os.path.exists(port_path)
-                        
                         port_info = {
                             "name": port_name,
                             "path": port_path,
                             "type": port_type,
                             "description": f"Serial port {port_name}",
-                            "connected": is_accessible
+                            # glob only returns existing device nodes
+                            "connected": True
                         }
                         
                         # Try to get additional info for USB devices
@@ -81,7 +228,7 @@ class HardwareDetector:
                 except Exception as e:
                     logger.error(f"Error detecting serial ports with pattern {pattern}: {e}")
         
-        elif platform.system() == 'Windows':
+        elif _PLATFORM == 'Windows':
             try:
                 import winreg
                 import itertools
@@ -112,31 +259,26 @@ class HardwareDetector:
         """Get USB device information for a USB serial port."""
         try:
             # Extract device number from port name (e.g., ttyUSB0 -> 0)
-            device_num = re.search(r'\d+$', port_name)
+            device_num = _DEVNUM_RE.search(port_name)
             if not device_num:
                 return None
             
-            # Try to find the USB device in sysfs
-            usb_path = f"/sys/class/tty/{port_name}/device"
-            if os.path.exists(usb_path):
-                # Follow symlinks to find USB device info
-                real_path = os.path.realpath(usb_path)
-                usb_device_path = real_path
-                
-                # Walk up the directory tree to find USB device info
-                while usb_device_path and not os.path.exists(os.path.join(usb_device_path, 'idVendor')):
-                    usb_device_path = os.path.dirname(usb_device_path)
-                
+            # Try to find the USB device in sysfs by following the class and
+            # device symlinks one readlink at a time
+            try:
+                tty_path = _resolve_sysfs_link(f"/sys/class/tty/{port_name}")
+                real_path = _resolve_sysfs_link(os.path.join(tty_path, 'device'))
+            except OSError:
+                real_path = None
+
+            if real_path:
+                # The USB device is the deepest "<bus>-<port>[.<port>...]" directory
+                # above the tty (e.g. .../usb1/1-1/1-1.2/1-1.2:1.0/ttyUSB0 -> .../1-1.2)
+                root_match = _USB_DEVICE_ROOT_RE.match(real_path + '/')
+                usb_device_path = root_match.group(1) if root_match else None
+
                 if usb_device_path and os.path.exists(os.path.join(usb_device_path, 'idVendor')):
-                    info = {}
-                    for attr in ['idVendor', 'idProduct', 'manufacturer', 'product', 'serial']:
-                        attr_path = os.path.join(usb_device_path, attr)
-                        if os.path.exists(attr_path):
-                            try:
-                                with open(attr_path, 'r') as f:
-                                    info[attr] = f.read().strip()
-                            except:
-                                pass
+                    info = _read_sysfs_attrs(usb_device_path, _USB_SERIAL_ATTRS)
                     return info if info else None
         except Exception as e:
             logger.debug(f"Error getting USB info for {port_name}: {e}")
@@ -147,20 +289,21 @@ class HardwareDetector:
     def _is_wifi_interface(interface_name: str) -> bool:
         """Check if an interface is a WiFi interface using multiple detection methods."""
         # Method 1: Check common WiFi interface name patterns
-        wifi_patterns = [
-            r'^wlan\d+$',      # wlan0, wlan1, etc.
-            r'^wl\w+$',        # wlp3s0, etc.
-            r'^wifi\d+$',      # wifi0, wifi1, etc.
-            r'^ath\d+$',       # ath0, ath1 (Atheros)
-            r'^ra\d+$',        # ra0, ra1 (Ralink)
-            r'^rtl\d+$',       # rtl0, rtl1 (Realtek)
-        ]
-        
-        for pattern in wifi_patterns:
-            if re.match(pattern, interface_name):
-                return True
+        if _WIFI_RE.match(interface_name):
+            return True
         
-        # Method 2: Check if interface has wireless extensions
+        # Method 2: Check sysfs for a wireless or phy80211 directory with a single listing.
+        # sysfs is authoritative when the interface is listed there, so iwconfig
+        # is only consulted when sysfs is unavailable for this interface
+        try:
+            names = set(os.listdir(f"/sys/class/net/{interface_name}"))
+        except OSError:
+            names = None
+
+        if names is not None:
+            return 'wireless' in names or 'phy80211' in names
+
+        # Method 3: Check if interface has wireless extensions
         try:
             # Check if interface appears in iwconfig output (indicates wireless capability)
             result = subprocess.run(
@@ -175,72 +318,104 @@ class HardwareDetector:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         
-        # Method 3: Check sysfs for wireless directory
-        try:
-            wireless_path = f"/sys/class/net/{interface_name}/wireless"
-            if os.path.exists(wireless_path):
-                return True
-        except:
-            pass
-        
-        # Method 4: Check if interface has a phy directory (indicating wireless)
-        try:
-            phy_path = f"/sys/class/net/{interface_name}/phy80211"
-            if os.path.exists(phy_path):
-                return True
-        except:
-            pass
-        
         return False
 
+    @staticmethod
+    def _read_netlink_interfaces() -> List[Dict[str, Any]]:
+        """
+        Query links and addresses over netlink.
+
+        Returns entries in the same shape as `ip -j addr show` so both sources
+        share one parsing path.
+        """
+        with IPRoute() as ipr:
+            links = ipr.get_links()
+            addrs = ipr.get_addr()
+
+        by_index: Dict[int, Dict[str, Any]] = {}
+        for link in links:
+            by_index[link['index']] = {
+                "ifname": link.get_attr('IFLA_IFNAME') or '',
+                "address": link.get_attr('IFLA_ADDRESS') or '',
+                "operstate": link.get_attr('IFLA_OPERSTATE') or 'UNKNOWN',
+                "mtu": link.get_attr('IFLA_MTU') or 0,
+                "addr_info": []
+            }
+
+        for addr in addrs:
+            iface = by_index.get(addr['index'])
+            if iface is None:
+                continue
+            local = addr.get_attr('IFA_LOCAL') or addr.get_attr('IFA_ADDRESS')
+            if local:
+                iface["addr_info"].append({"local": local})
+
+        return [by_index[index] for index in sorted(by_index)]
+
     @staticmethod
     def detect_network_interfaces() -> List[Dict[str, Any]]:
         """Detect all network interfaces on the system."""
         interfaces = []
         
-        if platform.system() == 'Linux':
+        if _PLATFORM == 'Linux':
             try:
-                # Get network interfaces using ip command
-                result = subprocess.run(
-                    ['ip', '-j', 'addr', 'show'],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
+                data = None
+                if PYROUTE2_AVAILABLE:
                     try:
-                        data = json.loads(result.stdout)
-                        for iface in data:
-                            interface_name = iface.get('ifname', '')
-                            
-                            # Determine interface type using improved detection
-                            interface_type = "Other"
-                            if interface_name == 'lo':
-                                interface_type = "Loopback"
-                            elif HardwareDetector._is_wifi_interface(interface_name):
-                                interface_type = "WiFi"
-                            elif interface_name.startswith('eth') or interface_name.startswith('en'):
-                                interface_type = "Ethernet"
-                            elif interface_name.startswith('br'):
-                                interface_type = "Bridge"
-                            elif interface_name.startswith('tun') or interface_name.startswith('tap'):
-                                interface_type = "VPN/Tunnel"
-                            elif interface_name.startswith('docker') or interface_name.startswith('veth'):
-                                interface_type = "Container"
-                            
-                            interfaces.append({
-                                "name": interface_name,
-                                "type": interface_type,
-                                "mac": iface.get('address', ''),
-                                "state": iface.get('operstate', 'UNKNOWN').upper(),
-                                "ip_addresses": [addr.get('local', '') for addr in iface.get('addr_info', []) if 'local' in addr],
-                                "mtu": iface.get('mtu', 0)
-                            })
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse network interface information")
+                        data = HardwareDetector._read_netlink_interfaces()
+                    except Exception as e:
+                        logger.debug(f"Netlink interface query failed, falling back to ip command: {e}")
+
+                if data is None:
+                    # Get network interfaces using ip command
+                    try:
+                        result = subprocess.run(
+                            ['ip', '-j', 'addr', 'show'],
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL,
+                            timeout=2
+                        )
+                    except subprocess.TimeoutExpired:
+                        logger.debug("Timed out waiting for 'ip addr show'")
+                        result = None
+
+                    if result is not None and result.returncode == 0:
+                        try:
+                            # Both orjson and json accept the raw bytes output
+                            data = _json.loads(result.stdout)
+                        except _json.JSONDecodeError:
+                            logger.error("Failed to parse network interface information")
+
+                if data:
+                    for iface in data:
+                        interface_name = iface.get('ifname', '')
+                        
+                        # Determine interface type using improved detection
+                        interface_type = "Other"
+                        if interface_name == 'lo':
+                            interface_type = "Loopback"
+                        elif HardwareDetector._is_wifi_interface(interface_name):
+                            interface_type = "WiFi"
+                        elif interface_name.startswith('eth') or interface_name.startswith('en'):
+                            interface_type = "Ethernet"
+                        elif interface_name.startswith('br'):
+                            interface_type = "Bridge"
+                        elif interface_name.startswith('tun') or interface_name.startswith('tap'):
+                            interface_type = "VPN/Tunnel"
+                        elif interface_name.startswith('docker') or interface_name.startswith('veth'):
+                            interface_type = "Container"
+                        
+                        interfaces.append({
+                            "name": interface_name,
+                            "type": interface_type,
+                            "mac": iface.get('address', ''),
+                            "state": iface.get('operstate', 'UNKNOWN').upper(),
+                            "ip_addresses": [addr['local'] for addr in iface.get('addr_info', ()) if 'local' in addr],
+                            "mtu": iface.get('mtu', 0)
+                        })
             except Exception as e:
                 logger.error(f"Error detecting network interfaces: {e}")
-        elif platform.system() == 'Windows':
+        elif _PLATFORM == 'Windows':
             try:
                 import wmi
                 c = wmi.WMI()
@@ -274,7 +449,7 @@ class HardwareDetector:
             "gpio_chips": []
         }
         
-        if platform.system() == 'Linux':
+        if _PLATFORM == 'Linux':
             try:
                 # Look for GPIO character devices in /dev
                 gpio_chips = glob.glob('/dev/gpiochip*')
@@ -287,19 +462,21 @@ class HardwareDetector:
                     try:
                         result = subprocess.run(
                             ['gpiodetect'],
-                            capture_output=True,
-                            text=True,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL,
                             timeout=5
                         )
                         
                         if result.returncode == 0:
                             # Parse gpiodetect output
-                            for line in result.stdout.split('\n'):
+                            for line in result.stdout.splitlines():
                                 if line.strip():
                                     # Format: gpiochip0 [label] (ngpio lines)
-                                    match = re.match(r'(gpiochip\d+)\s+\[([^\]]+)\]\s+\((\d+)\s+lines\)', line)
+                                    match = _GPIOCHIP_RE.match(line)
                                     if match:
-                                        chip_name, label, ngpio = match.groups()
+                                        chip_name = match.group(1).decode('ascii')
+                                        label = match.group(2).decode('utf-8', 'replace')
+                                        ngpio = match.group(3)
                                         gpio_info["gpio_chips"].append({
                                             "name": chip_name,
                                             "path": f"/dev/{chip_name}",
@@ -308,8 +485,9 @@ class HardwareDetector:
                                         })
                     except (subprocess.TimeoutExpired, FileNotFoundError):
                         # gpiodetect not available or timed out, use basic detection
-                        logger.debug("gpiodetect not available, using basic GPIO detection")
-                        
+                        logger.debug("gpiodetect not available or timed out, using basic GPIO detection")
+
+                        sysfs_chips = set(_list_sysfs_gpio_chips() or ())
                         for chip_path in gpio_chips:
                             chip_name = os.path.basename(chip_path)
                             chip_info = {
@@ -320,82 +498,109 @@ class HardwareDetector:
                             }
                             
                             # Try to get info from sysfs if available
-                            sys_path = f"/sys/class/gpio/{chip_name}"
-                            if os.path.exists(sys_path):
-                                try:
-                                    label_path = os.path.join(sys_path, 'label')
-                                    if os.path.exists(label_path):
-                                        with open(label_path, 'r') as f:
-                                            chip_info["label"] = f.read().strip()
-                                except:
-                                    pass
-                                    
-                                try:
-                                    ngpio_path = os.path.join(sys_path, 'ngpio')
-                                    if os.path.exists(ngpio_path):
-                                        with open(ngpio_path, 'r') as f:
-                                            chip_info["ngpio"] = int(f.read().strip())
-                                except:
-                                    pass
+                            if chip_name in sysfs_chips:
+                                attrs = _read_sysfs_attrs(os.path.join(GPIO_SYSFS_PATH, chip_name), ('label', 'ngpio'))
+                            else:
+                                attrs = {}
+                            if 'label' in attrs:
+                                chip_info["label"] = attrs['label']
+                            try:
+                                if 'ngpio' in attrs:
+                                    chip_info["ngpio"] = int(attrs['ngpio'])
+                            except ValueError:
+                                pass
                             
                             gpio_info["gpio_chips"].append(chip_info)
                 
                 # Also check for legacy sysfs GPIO interface
-                legacy_gpio_path = '/sys/class/gpio'
-                if os.path.exists(legacy_gpio_path) and not gpio_info["available"]:
-                    gpio_info["available"] = True
-                    gpio_info["legacy_interface"] = True
-                    
-                    # Count available GPIO chips in legacy interface
-                    try:
-                        legacy_chips = [d for d in os.listdir(legacy_gpio_path) if d.startswith('gpiochip')]
+                if not gpio_info["available"]:
+                    legacy_chips = _list_sysfs_gpio_chips()
+                    if legacy_chips is not None:
+                        gpio_info["available"] = True
+                        gpio_info["legacy_interface"] = True
+                        # Count available GPIO chips in legacy interface
                         gpio_info["chip_count"] = len(legacy_chips)
-                    except:
-                        pass
                         
             except Exception as e:
                 logger.error(f"Error detecting GPIO: {e}")
         
         return gpio_info
 
+    @staticmethod
+    def _detect_usb_devices_sysfs() -> List[Dict[str, Any]]:
+        """Enumerate USB devices directly from /sys/bus/usb/devices."""
+        usb_devices = []
+
+        with os.scandir(USB_SYSFS_PATH) as entries:
+            device_dirs = [entry.path for entry in entries if _USB_SYSFS_DEVICE_RE.match(entry.name)]
+
+        for device_path in device_dirs:
+            attrs = _read_sysfs_attrs(device_path, _USB_DEVICE_ATTRS)
+            vid = attrs.get('idVendor')
+            pid = attrs.get('idProduct')
+            busnum = attrs.get('busnum')
+            devnum = attrs.get('devnum')
+            if not (vid and pid and busnum and devnum):
+                continue
+
+            desc = " ".join(
+                part for part in (attrs.get('manufacturer'), attrs.get('product')) if part
+            ) or "Unknown USB Device"
+
+            bus = busnum.zfill(3)
+            device = devnum.zfill(3)
+            usb_devices.append({
+                "bus": f"Bus {bus}",
+                "device": f"Device {device}",
+                "vendor_id": vid,
+                "product_id": pid,
+                "description": desc,
+                "path": f"/dev/bus/usb/{bus}/{device}"
+            })
+
+        usb_devices.sort(key=lambda d: d["path"])
+        return usb_devices
+
     @staticmethod
     def detect_usb_devices() -> List[Dict[str, Any]]:
         """Detect USB devices connected to the system."""
         usb_devices = []
         
-        if platform.system() == 'Linux':
+        if _PLATFORM == 'Linux':
+            if os.path.isdir(USB_SYSFS_PATH):
+                try:
+                    return HardwareDetector._detect_usb_devices_sysfs()
+                except Exception as e:
+                    logger.warning(f"Error detecting USB devices from sysfs, falling back to lsusb: {e}")
+
             try:
-                # Use lsusb to get USB device information
-                result = subprocess.run(
-                    ['lsusb'],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if not line.strip():
-                            continue
-                            
-                        # Parse lsusb output
-                        match = re.match(
-                            r'Bus (\d+) Device (\d+): ID ([0-9a-fA-F]{4}):([0-9a-fA-F]{4})\s+(.+)',
-                            line
-                        )
-                        
-                        if match:
-                            bus, device, vid, pid, desc = match.groups()
-                            usb_devices.append({
-                                "bus": f"Bus {bus}",
-                                "device": f"Device {device}",
-                                "vendor_id": vid,
-                                "product_id": pid,
-                                "description": desc,
-                                "path": f"/dev/bus/usb/{bus.zfill(3)}/{device.zfill(3)}"
-                            })
+                # Fall back to lsusb when sysfs is not available or cannot be read
+                try:
+                    result = subprocess.run(
+                        ['lsusb'],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        timeout=2
+                    )
+                except subprocess.TimeoutExpired:
+                    logger.debug("Timed out waiting for lsusb")
+                    result = None
+
+                if result is not None and result.returncode == 0:
+                    # One pass over the whole output; non-matching lines are skipped by the regex
+                    for match in _LSUSB_RE.finditer(result.stdout):
+                        bus, device, vid, pid = (group.decode('ascii') for group in match.groups()[:4])
+                        usb_devices.append({
+                            "bus": f"Bus {bus}",
+                            "device": f"Device {device}",
+                            "vendor_id": vid,
+                            "product_id": pid,
+                            "description": match.group(5).decode('utf-8', 'replace'),
+                            "path": f"/dev/bus/usb/{bus.zfill(3)}/{device.zfill(3)}"
+                        })
             except Exception as e:
                 logger.error(f"Error detecting USB devices: {e}")
-        elif platform.system() == 'Windows':
+        elif _PLATFORM == 'Windows':
             try:
                 import wmi
                 c = wmi.WMI()
@@ -422,6 +627,20 @@ class HardwareDetector:
         
         return usb_devices
 
+    @classmethod
+    def _system_info(cls) -> Dict[str, str]:
+        """Return platform details, computed once since they do not change for the process lifetime."""
+        if cls._system_info_cache is None:
+            cls._system_info_cache = {
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "system": _PLATFORM,
+                "release": platform.release(),
+                "version": platform.version()
+            }
+        return cls._system_info_cache
+
     @classmethod
     def detect_all_hardware(cls) -> Dict[str, Any]:
         """
@@ -430,17 +649,167 @@ class HardwareDetector:
         Returns:
             Dictionary containing information about all detected hardware.
         """
-        return {
+        cls._ensure_hotplug_watcher()
+
+        now = time.monotonic()
+        ttl = cls._WATCHED_TTL if cls._watched_sections >= _HOTPLUG_SECTIONS else cls._TTL
+        if cls._all_cache is not None and now - cls._all_cache_ts < ttl:
+            return cls._all_cache
+
+        generation = cls._cache_generation
+        hardware = {
             "serial_ports": cls.detect_serial_ports(),
             "network_interfaces": cls.detect_network_interfaces(),
             "gpio": cls.detect_gpio(),
             "usb_devices": cls.detect_usb_devices(),
-            "system": {
-                "platform": platform.platform(),
-                "machine": platform.machine(),
-                "processor": platform.processor(),
-                "system": platform.system(),
-                "release": platform.release(),
-                "version": platform.version()
-            }
+            "system": cls._system_info()
         }
+
+        if generation == cls._cache_generation:
+            cls._all_cache = hardware
+            cls._all_cache_ts = now
+        return hardware
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop the cached detect_all_hardware result so the next call re-detects."""
+        cls._cache_generation += 1
+        cls._all_cache = None
+        cls._all_cache_ts = 0.0
+
+    @staticmethod
+    def _open_hotplug_sources() -> List[tuple]:
+        """Open the change sources available on this host, each paired with the sections it can report."""
+        sources = []
+
+        # Kernel uevents: device add/remove for every subsystem (tty, net, gpio, usb)
+        try:
+            uevent = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM | socket.SOCK_NONBLOCK,
+                                   _NETLINK_KOBJECT_UEVENT)
+            try:
+                uevent.bind((0, _UEVENT_KERNEL_GROUP))
+            except OSError:
+                uevent.close()
+                raise
+            sources.append((uevent, _HOTPLUG_SECTIONS))
+        except OSError as e:
+            logger.debug(f"Cannot subscribe to kernel uevents: {e}")
+
+        # rtnetlink: interface state and address changes, which produce no uevent
+        try:
+            rtnl = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW | socket.SOCK_NONBLOCK,
+                                 socket.NETLINK_ROUTE)
+            try:
+                rtnl.bind((0, _RTNL_HOTPLUG_GROUPS))
+            except OSError:
+                rtnl.close()
+                raise
+            sources.append((rtnl, frozenset({'network_interfaces'})))
+        except OSError as e:
+            logger.debug(f"Cannot subscribe to rtnetlink link/address events: {e}")
+
+        # inotify on /dev: device nodes created or removed by devtmpfs/udev
+        if INOTIFY_AVAILABLE:
+            try:
+                inotify = INotify()
+                try:
+                    inotify.add_watch(_DEV_WATCH_PATH, inotify_flags.CREATE | inotify_flags.DELETE |
+                                      inotify_flags.MOVED_FROM | inotify_flags.MOVED_TO)
+                except OSError:
+                    inotify.close()
+                    raise
+                sources.append((inotify, frozenset({'serial_ports', 'gpio'})))
+            except OSError as e:
+                logger.debug(f"Cannot watch {_DEV_WATCH_PATH} for hardware changes: {e}")
+
+        return sources
+
+    @classmethod
+    def _ensure_hotplug_watcher(cls) -> None:
+        """Start the hotplug watcher once, subscribing to whatever change sources are available."""
+        if _PLATFORM != 'Linux' or cls._watcher_thread is not None:
+            return
+
+        with cls._watcher_lock:
+            if cls._watcher_thread is not None:
+                return
+
+            sources = cls._open_hotplug_sources()
+            if not sources:
+                logger.debug("No hardware change sources available, using TTL-only hardware cache")
+                return
+
+            thread = threading.Thread(
+                target=cls._watch_hotplug_events,
+                args=(sources,),
+                name="hardware-hotplug-watcher",
+                daemon=True
+            )
+            thread.start()
+            cls._watcher_thread = thread
+            logger.info(f"Hardware hotplug watcher started with {len(sources)} change sources")
+
+    @classmethod
+    def _drain_hotplug_source(cls, source, sections) -> set:
+        """Consume every pending event on a source and return the sections they showed changes for.
+
+        Raises OSError if the source itself failed.
+        """
+        if not isinstance(source, socket.socket):
+            return set(sections) if source.read(timeout=0) else set()
+
+        reported = set()
+        while True:
+            try:
+                message = source.recv(65536)
+            except BlockingIOError:
+                return reported
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                # The kernel dropped events: something changed, but not what
+                cls.invalidate_cache()
+                continue
+            if source.proto == _NETLINK_KOBJECT_UEVENT:
+                section = _uevent_section(message)
+                if section in sections:
+                    reported.add(section)
+            else:
+                reported.update(sections)
+
+    @classmethod
+    def _watch_hotplug_events(cls, sources) -> None:
+        """Invalidate the hardware cache whenever a change source reports an event.
+
+        A source only counts towards _watched_sections for a section once it has delivered an
+        event for it: in a container's network namespace, for example, the uevent socket opens
+        fine but the kernel never sends it USB, tty or GPIO events.
+        """
+        credited = {source: set() for source, _ in sources}
+        restart = False
+        try:
+            while sources:
+                ready, _, _ = select.select([source for source, _ in sources], [], [])
+                for source, sections in list(sources):
+                    if source not in ready:
+                        continue
+                    try:
+                        credited[source] |= cls._drain_hotplug_source(source, sections)
+                    except OSError as e:
+                        logger.warning(f"Hardware change source failed, no longer watching it: {e}")
+                        sources.remove((source, sections))
+                        del credited[source]
+                        source.close()
+                cls._watched_sections = frozenset().union(*credited.values())
+                cls.invalidate_cache()
+            logger.warning("No hardware change sources left, using TTL-only hardware cache")
+        except Exception as e:
+            logger.error(f"Hardware hotplug watcher stopped: {e}")
+            restart = True
+
+        cls._watched_sections = frozenset()
+        for source, _ in sources:
+            source.close()
+        if restart:
+            # Let the next detect_all_hardware call start a fresh watcher
+            cls._watcher_thread = None
@@ -1,32 +1,70 @@
 # Updated to use centralized polling logger and enhanced error handling
 from app.logging_config import get_polling_logger, get_error_logger, log_error_with_context
-from app.services.last_seen import update_last_successful_timestamp
+from app.services.last_seen import update_last_successful_timestamps
 
 import c104
+import functools
 import time
+import threading
 import logging
 import re
-from typing import Dict, Any, List, Tuple, Optional
+import sys
+from typing import Dict, Any, Callable, List, NamedTuple, Tuple, Optional
 from enum import IntEnum
 
+_BOOL_FALSE_STRINGS = frozenset({'false', 'f', '0', 'off', 'no'})
+_BOOL_TRUE_STRINGS = frozenset({'true', 't', '1', 'on', 'yes'})
+
 def convert_to_boolean(value):
     """Convert various value types to boolean, handling string 'false' correctly"""
     if isinstance(value, str):
         value_lower = value.lower().strip()
-        if value_lower in ('false', 'f', '0', 'off', 'no'):
+        if value_lower in _BOOL_FALSE_STRINGS:
             return False
-        elif value_lower in ('true', 't', '1', 'on', 'yes'):
+        if value_lower in _BOOL_TRUE_STRINGS:
             return True
-        else:
-            # For other strings, use standard boolean conversion
-            return bool(value)
-    elif isinstance(value, (int, float)):
-        return bool(value)
-    else:
-        return bool(value)
+    # Non-strings and other strings use standard boolean conversion
+    return bool(value)
 
 logger = get_polling_logger()
 
+# Connection states in which the link can carry data
+_OPEN_CONNECTION_STATES = frozenset({c104.ConnectionState.OPEN, c104.ConnectionState.OPEN_MUTED})
+
+# Upper bound on waiting for a new connection to open
+IEC104_CONNECT_TIMEOUT_S = 2.0
+
+# Upper bound on waiting for General Interrogation responses after the command is sent
+IEC104_INTERROGATION_WINDOW_S = 0.5
+
+# Delay after spontaneous data wakes the poller, so a burst is published in one update
+IEC104_DATA_COALESCE_S = 0.05
+# Longest a polling thread blocks before re-checking its stop flag
+IEC104_STOP_CHECK_S = 0.1
+# Unchanged tag status is re-persisted to the last-seen store at most this often
+IEC104_TIMESTAMP_HEARTBEAT_S = 60
+# Pooled clients unused for this long are disconnected by the pool reaper
+IEC104_CLIENT_IDLE_TTL_S = 60.0
+
+# Map type_id strings to c104 Type enums
+_TYPE_MAP = {
+    "M_SP_NA_1": c104.Type.M_SP_NA_1,
+    "M_DP_NA_1": c104.Type.M_DP_NA_1,
+    "M_ST_NA_1": c104.Type.M_ST_NA_1,
+    "M_ME_NA_1": c104.Type.M_ME_NA_1,
+    "M_ME_NB_1": c104.Type.M_ME_NB_1,
+    "M_ME_NC_1": c104.Type.M_ME_NC_1,
+    "M_IT_NA_1": c104.Type.M_IT_NA_1,
+    "C_SC_NA_1": c104.Type.C_SC_NA_1,
+    "C_DC_NA_1": c104.Type.C_DC_NA_1,
+    "C_RC_NA_1": c104.Type.C_RC_NA_1,
+    "C_SE_NA_1": c104.Type.C_SE_NA_1,
+    "C_SE_NB_1": c104.Type.C_SE_NB_1,
+    "C_SE_NC_1": c104.Type.C_SE_NC_1,
+}
+_DEFAULT_TYPE = c104.Type.M_SP_NA_1  # Default monitoring type
+_DEFAULT_COMMAND_TYPE = c104.Type.C_SC_NA_1  # Default command type
+
 # IEC 60870-5-104 Protocol Constants (for backward compatibility)
 class TypeID(IntEnum):
     """IEC-104 Type Identification"""
@@ -124,112 +162,127 @@ IEC104_COMMAND_ERROR_CODES = {
 
 def get_iec104_cot_error_verbose(cot_code: int) -> str:
     """Get verbose description for IEC-104 Cause of Transmission error code"""
-    return IEC104_COT_ERROR_CODES.get(cot_code, f"Unknown COT error code: {cot_code}")
+    description = IEC104_COT_ERROR_CODES.get(cot_code)
+    return description if description is not None else f"Unknown COT error code: {cot_code}"
 
 def get_iec104_reject_verbose(reject_code: int) -> str:
     """Get verbose description for IEC-104 reject code"""
-    return IEC104_REJECT_CODES.get(reject_code, f"Unknown reject code: {reject_code}")
+    description = IEC104_REJECT_CODES.get(reject_code)
+    return description if description is not None else f"Unknown reject code: {reject_code}"
 
 def get_iec104_connection_error_verbose(state_code: int) -> str:
     """Get verbose description for IEC-104 connection state"""
-    return IEC104_CONNECTION_ERROR_CODES.get(state_code, f"Unknown connection state: {state_code}")
+    description = IEC104_CONNECTION_ERROR_CODES.get(state_code)
+    return description if description is not None else f"Unknown connection state: {state_code}"
+
+def _build_quality_descriptions() -> List[str]:
+    """Precompute the description for every 8-bit quality descriptor value"""
+    descriptions = []
+    for quality_flags in range(256):
+        errors = [description for flag, description in IEC104_QUALITY_ERROR_CODES.items() if quality_flags & flag]
+        descriptions.append("; ".join(errors) if errors else "GOOD: No quality issues detected")
+    return descriptions
+
+_QUALITY_DESCRIPTIONS = _build_quality_descriptions()
 
 def get_iec104_quality_error_verbose(quality_flags: int) -> str:
     """Get verbose description for IEC-104 quality descriptor flags"""
-    errors = []
-    for flag, description in IEC104_QUALITY_ERROR_CODES.items():
-        if quality_flags & flag:
-            errors.append(description)
-    
-    if errors:
-        return "; ".join(errors)
-    else:
-        return "GOOD: No quality issues detected"
+    # All defined flags live in the low byte
+    return _QUALITY_DESCRIPTIONS[quality_flags & 0xFF]
 
 def get_iec104_command_error_verbose(command_state: int) -> str:
     """Get verbose description for IEC-104 command error codes"""
-    return IEC104_COMMAND_ERROR_CODES.get(command_state, f"Unknown command state: {command_state}")
+    description = IEC104_COMMAND_ERROR_CODES.get(command_state)
+    return description if description is not None else f"Unknown command state: {command_state}"
+
+# Error message patterns, tried in priority order (each alternative is a set of lookaheads at position 0)
+_ERROR_PATTERN_RE = re.compile(
+    r'^(?:'
+    r'(?P<timeout>(?=.*timeout))'
+    r'|(?P<connection>(?=.*connection)(?=.*(?:refused|failed)))'
+    r'|(?P<unknown_type>(?=.*unknown)(?=.*type))'
+    r'|(?P<unknown_address>(?=.*unknown)(?=.*address))'
+    r'|(?P<not_permitted>(?=.*not permitted))'
+    r'|(?P<blocked>(?=.*blocked))'
+    r'|(?P<invalid>(?=.*invalid))'
+    r')',
+    re.DOTALL
+)
+_ERROR_PATTERN_CODES = {
+    'timeout': (1, "TIMEOUT - Connection or operation timeout"),  # From COMMAND_ERROR_CODES: TIMEOUT
+    'connection': (7, "CONNECTION_ERROR - Unable to establish connection to IEC-104 server"),  # From CONNECTION_ERROR_CODES: ERROR state
+    'unknown_type': (44, get_iec104_cot_error_verbose(44)),
+    'unknown_address': (47, get_iec104_cot_error_verbose(47)),
+    'not_permitted': (6, get_iec104_reject_verbose(6)),
+    'blocked': (10, get_iec104_reject_verbose(10)),
+    'invalid': (4, get_iec104_reject_verbose(4)),
+}
+
+# Field layout of every error_info dict returned by extract_iec104_error_details
+_ERROR_TEMPLATE = {
+    'error_type': None,
+    'error_code': None,
+    'error_message': None,
+    'verbose_description': None,
+    'connection_state': None,
+    'quality_flags': None,
+    'cot_code': None,
+    'additional_info': None,
+}
 
 def extract_iec104_error_details(error_result, connection_state=None, quality_flags=None, cot_code=None):
     """Extract detailed error information from IEC-104 responses"""
-    error_info = {
-        'error_type': None,
-        'error_code': None,
-        'error_message': str(error_result),
-        'verbose_description': None,
-        'connection_state': None,
-        'quality_flags': None,
-        'cot_code': None,
-        'additional_info': {}
-    }
+    error_info = _ERROR_TEMPLATE.copy()
+    error_info['error_message'] = str(error_result)
+    error_info['additional_info'] = {}
     
     # Handle c104 specific errors
     if hasattr(error_result, '__class__'):
         error_info['error_type'] = error_result.__class__.__name__
     
+    # Description fragments from connection state, quality and COT, joined once at the end
+    parts: List[str] = []
+    
     # Handle connection state information - ensure JSON serializable
     if connection_state is not None:
         # Convert enum or object to string/int for JSON serialization
-        if hasattr(connection_state, 'value'):  # Enum object
-            error_info['connection_state'] = str(connection_state.value)
-        elif hasattr(connection_state, 'name'):  # Enum object
-            error_info['connection_state'] = str(connection_state.name)  
-        else:
-            error_info['connection_state'] = str(connection_state)
+        try:
+            state_value = connection_state.value  # Enum object
+            error_info['connection_state'] = str(state_value)
+        except AttributeError:
+            state_value = connection_state
+            error_info['connection_state'] = str(getattr(connection_state, 'name', connection_state))
         
         # Get numeric value for error code lookup
-        state_code = getattr(connection_state, 'value', connection_state) if hasattr(connection_state, 'value') else connection_state
         try:
-            state_code = int(state_code) if state_code is not None else 0
+            state_code = int(state_value)
         except (ValueError, TypeError):
             state_code = 0
-        error_info['verbose_description'] = get_iec104_connection_error_verbose(state_code)
+        parts.append(get_iec104_connection_error_verbose(state_code))
         # Set error code based on connection state
         if state_code != 0:  # 0 is success/connected state
             error_info['error_code'] = state_code
     
     # Handle quality flags for measured values - ensure JSON serializable
     if quality_flags is not None:
-        error_info['quality_flags'] = int(quality_flags) if quality_flags is not None else 0
-        quality_desc = get_iec104_quality_error_verbose(error_info['quality_flags'])
-        if error_info['verbose_description']:
-            error_info['verbose_description'] += f"; Quality: {quality_desc}"
-        else:
-            error_info['verbose_description'] = f"Quality: {quality_desc}"
+        error_info['quality_flags'] = int(quality_flags)
+        parts.append(f"Quality: {get_iec104_quality_error_verbose(error_info['quality_flags'])}")
     
     # Handle cause of transmission codes - ensure JSON serializable  
     if cot_code is not None:
-        error_info['cot_code'] = int(cot_code) if cot_code is not None else 0
-        cot_desc = get_iec104_cot_error_verbose(error_info['cot_code'])
-        if error_info['verbose_description']:
-            error_info['verbose_description'] += f"; COT: {cot_desc}"
-        else:
-            error_info['verbose_description'] = f"COT: {cot_desc}"
+        error_info['cot_code'] = int(cot_code)
+        parts.append(f"COT: {get_iec104_cot_error_verbose(error_info['cot_code'])}")
+        
+    if parts:
+        error_info['verbose_description'] = "; ".join(parts)
+        
     # Try to extract error codes from error message string
     error_str = str(error_result).lower()
     
     # Common IEC-104 error patterns - using proper IEC standard codes
-    if 'timeout' in error_str:
-        error_info['error_code'] = 1  # From COMMAND_ERROR_CODES: TIMEOUT
-        error_info['verbose_description'] = "TIMEOUT - Connection or operation timeout"
-    elif 'connection' in error_str and ('refused' in error_str or 'failed' in error_str):
-        error_info['error_code'] = 7  # From CONNECTION_ERROR_CODES: ERROR state
-        error_info['verbose_description'] = "CONNECTION_ERROR - Unable to establish connection to IEC-104 server"
-    elif 'unknown' in error_str and 'type' in error_str:
-        error_info['error_code'] = 44
-        error_info['verbose_description'] = get_iec104_cot_error_verbose(44)
-    elif 'unknown' in error_str and 'address' in error_str:
-        error_info['error_code'] = 47
-        error_info['verbose_description'] = get_iec104_cot_error_verbose(47)
-    elif 'not permitted' in error_str:
-        error_info['error_code'] = 6
-        error_info['verbose_description'] = get_iec104_reject_verbose(6)
-    elif 'blocked' in error_str:
-        error_info['error_code'] = 10
-        error_info['verbose_description'] = get_iec104_reject_verbose(10)
-    elif 'invalid' in error_str:
-        error_info['error_code'] = 4
-        error_info['verbose_description'] = get_iec104_reject_verbose(4)
+    match = _ERROR_PATTERN_RE.match(error_str)
+    if match:
+        error_info['error_code'], error_info['verbose_description'] = _ERROR_PATTERN_CODES[match.lastgroup]
     
     # Apply standardized error format: (ERROR_CODE - ERROR DESCRIPTION/MESSAGE)
     if error_info['verbose_description'] and error_info['error_code'] is not None:
@@ -241,34 +294,58 @@ def extract_iec104_error_details(error_result, connection_state=None, quality_fl
         error_info['verbose_description'] = f"({error_code} - IEC-104 Error: {error_info['error_message']})"
     
     return error_info
+
+NO_ADDRESS_ERROR = "No address specified"
+
+# Error details for fixed failure messages, built once and shared (callers only read them)
+_ERR_NO_ADDRESS = extract_iec104_error_details(NO_ADDRESS_ERROR)
+_ERR_NO_HOST = extract_iec104_error_details("No host specified in device config (iec104IpAddress or ip)")
+_ERR_NOT_CONNECTED = extract_iec104_error_details("Client not connected", connection_state=0)  # CLOSED
+_ERR_TRANSMIT_FAILED = extract_iec104_error_details("Failed to transmit command", cot_code=6)  # Command not permitted
+
+# HTTP status per IEC-104 error code, indexed directly by code (anything unlisted -> 500)
+_HTTP_STATUS_BY_CODE = [500] * 48
+_HTTP_STATUS_BY_CODE[0] = 200   # SUCCESS -> OK
+_HTTP_STATUS_BY_CODE[1] = 408   # TIMEOUT -> Request Timeout
+_HTTP_STATUS_BY_CODE[2] = 503   # CONNECTION_REFUSED -> Service Unavailable
+_HTTP_STATUS_BY_CODE[4] = 400   # INVALID_QUALIFIER -> Bad Request
+_HTTP_STATUS_BY_CODE[5] = 400   # INVALID_IOA -> Bad Request
+_HTTP_STATUS_BY_CODE[6] = 405   # COMMAND_NOT_PERMITTED -> Method Not Allowed
+_HTTP_STATUS_BY_CODE[7] = 503   # CONNECTION_ERROR -> Service Unavailable (unsupported types use 44)
+_HTTP_STATUS_BY_CODE[8] = 503   # TEMPORARY_UNAVAILABLE -> Service Unavailable
+_HTTP_STATUS_BY_CODE[9] = 409   # LOCAL_OVERRIDE_ACTIVE -> Conflict
+_HTTP_STATUS_BY_CODE[10] = 423  # OBJECT_BLOCKED -> Locked
+_HTTP_STATUS_BY_CODE[11] = 503  # SUBSTATION_NOT_READY -> Service Unavailable
+_HTTP_STATUS_BY_CODE[12] = 500  # DEVICE_TROUBLE -> Internal Server Error
+_HTTP_STATUS_BY_CODE[44] = 501  # UNKNOWN_TYPE_ID -> Not Implemented
+_HTTP_STATUS_BY_CODE[45] = 400  # UNKNOWN_COT -> Bad Request
+_HTTP_STATUS_BY_CODE[46] = 400  # UNKNOWN_CA -> Bad Request
+_HTTP_STATUS_BY_CODE[47] = 404  # UNKNOWN_IOA -> Not Found
+
 def map_iec104_error_to_http_status(iec104_error_code: int) -> int:
     """Map IEC-104 error codes to appropriate HTTP status codes"""
-    mapping = {
-        0: 200,  # SUCCESS -> OK
-        1: 408,  # TIMEOUT -> Request Timeout
-        2: 503,  # CONNECTION_REFUSED -> Service Unavailable
-        7: 503,  # CONNECTION_ERROR -> Service Unavailable
-        4: 400,  # INVALID_QUALIFIER -> Bad Request
-        5: 400,  # INVALID_IOA -> Bad Request
-        6: 405,  # COMMAND_NOT_PERMITTED -> Method Not Allowed
-        7: 501,  # TYPE_ID_NOT_SUPPORTED -> Not Implemented
-        8: 503,  # TEMPORARY_UNAVAILABLE -> Service Unavailable
-        9: 409,  # LOCAL_OVERRIDE_ACTIVE -> Conflict
-        10: 423, # OBJECT_BLOCKED -> Locked
-        11: 503, # SUBSTATION_NOT_READY -> Service Unavailable
-        12: 500, # DEVICE_TROUBLE -> Internal Server Error
-        44: 501, # UNKNOWN_TYPE_ID -> Not Implemented
-        45: 400, # UNKNOWN_COT -> Bad Request
-        46: 400, # UNKNOWN_CA -> Bad Request
-        47: 404, # UNKNOWN_IOA -> Not Found
-    }
-    return mapping.get(iec104_error_code, 500)  # Default to Internal Server Error
+    if isinstance(iec104_error_code, int) and 0 <= iec104_error_code < len(_HTTP_STATUS_BY_CODE):
+        return _HTTP_STATUS_BY_CODE[iec104_error_code]
+    return 500  # Default to Internal Server Error
 
+# 'TYPE:IOA' or 'IOA', with optional whitespace around each part
+_ADDRESS_RE = re.compile(r'^(?:([^:]*):)?\s*(\d+)\s*$')
+
+# Sized for deployments with tens of thousands of IOAs
+@functools.lru_cache(maxsize=65536)
 def parse_iec104_address(address: str) -> Tuple[str, int, Optional[str]]:
     """
     Parse IEC-104 address in format 'TYPE:IOA' or just 'IOA'
     Returns: (type_id, ioa, error)
     """
+    match = _ADDRESS_RE.match(address)
+    if match:
+        type_part, ioa_part = match.groups()
+        # Interned so type_id lookups in the module tables hit the identity fast path
+        type_id = sys.intern(type_part.strip()) if type_part is not None else "M_SP_NA_1"
+        return type_id, int(ioa_part), None
+        
+    # Anything else (signs, malformed input) goes through int() for its exact result or error message
     try:
         if ':' in address:
             # Format: M_ME_NA_1:1794
@@ -283,6 +360,57 @@ def parse_iec104_address(address: str) -> Tuple[str, int, Optional[str]]:
     except ValueError as e:
         return "M_SP_NA_1", 0, f"Invalid address format '{address}': {e}"
 
+def _convert_via_str(value):
+    """Extract a numeric value from an arbitrary c104 object through its string form"""
+    try:
+        return float(str(value))
+    except (ValueError, TypeError):
+        return str(value)
+
+def _identity(value):
+    return value
+
+# Converter per value type, memoized the first time each type is seen
+_VALUE_CONVERTERS: Dict[type, Callable[[Any], Any]] = {float: float, int: float, bool: float, str: _identity}
+
+def _select_value_converter(value_type: type) -> Callable[[Any], Any]:
+    """Pick the conversion for a value type (float, then int, then bool, then primitives)"""
+    if hasattr(value_type, '__float__'):
+        return float
+    elif hasattr(value_type, '__int__'):
+        return int
+    elif hasattr(value_type, '__bool__'):
+        return bool
+    elif issubclass(value_type, (int, float, bool, str)):
+        return _identity
+    # For any other c104 object, try to extract numeric value
+    return _convert_via_str
+
+def to_python_primitive(value):
+    """Convert a c104 value object to a Python primitive"""
+    value_type = type(value)
+    converter = _VALUE_CONVERTERS.get(value_type)
+    if converter is None:
+        converter = _VALUE_CONVERTERS[value_type] = _select_value_converter(value_type)
+    return converter(value)
+
+# Python type of the value carried by each type_id
+_VALUE_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "M_SP_NA_1": bool,   # Single point
+    "M_DP_NA_1": int,    # Double point (c104.Double)
+    "M_ST_NA_1": int,    # Step position (c104.Int7)
+    "M_ME_NA_1": float,  # Normalized (c104.NormalizedFloat)
+    "M_ME_NB_1": int,    # Scaled (c104.Int16)
+    "M_ME_NC_1": float,  # Short float
+    "M_IT_NA_1": int,    # Integrated totals
+    "C_SC_NA_1": bool,   # Single command
+    "C_DC_NA_1": int,    # Double command (c104.Double)
+    "C_RC_NA_1": int,    # Regulating step command (c104.Step)
+    "C_SE_NA_1": float,  # Normalized set point
+    "C_SE_NB_1": int,    # Scaled set point (c104.Int16)
+    "C_SE_NC_1": float,  # Short float set point
+}
+
 def convert_c104_value_to_python(info, type_id: str):
     """
     Convert c104 library objects to Python primitive types for serialization
@@ -292,30 +420,49 @@ def convert_c104_value_to_python(info, type_id: str):
             return None
             
         value = info.value
-        
-        # Convert c104 objects to Python primitives
-        if hasattr(value, '__float__'):
-            return float(value)
-        elif hasattr(value, '__int__'):
-            return int(value)
-        elif hasattr(value, '__bool__'):
-            return bool(value)
-        elif isinstance(value, (int, float, bool, str)):
-            return value
-        else:
-            # For any other c104 object, try to extract numeric value
+        coerce = _VALUE_COERCERS.get(type_id)
+        if coerce is not None:
             try:
-                return float(str(value))
-            except (ValueError, TypeError):
-                return str(value)
+                return coerce(value)
+            except (TypeError, ValueError):
+                pass  # Point type differs from the configured one; use the generic conversion
+        return to_python_primitive(value)
                 
     except Exception as e:
-        logger.warning(f"Error converting c104 value to Python type: {e}")
+        logger.warning("Error converting c104 value to Python type: %s", e)
         return None
 
+# Monitoring type_id -> command type_id used when writing to a monitoring address
+_READ_TO_WRITE = {
+    'M_SP_NA_1': 'C_SC_NA_1',  # Single point -> Single command
+    'M_DP_NA_1': 'C_DC_NA_1',  # Double point -> Double command
+    'M_ME_NA_1': 'C_SE_NA_1',  # Measured normalized -> Set normalized
+    'M_ME_NB_1': 'C_SE_NB_1',  # Measured scaled -> Set scaled
+    'M_ME_NC_1': 'C_SE_NC_1',  # Measured float -> Set float
+}
+
+# Command object builders per command type_id
+_CMD_BUILDERS: Dict[str, Callable[[Any], Any]] = {
+    # Single command - accepts boolean directly with proper string handling
+    "C_SC_NA_1": lambda value: c104.SingleCmd(convert_to_boolean(value)),
+    # Double command - expects c104.Double enum
+    "C_DC_NA_1": lambda value: c104.DoubleCmd(c104.Double.ON if convert_to_boolean(value) else c104.Double.OFF),
+    # Step command - expects c104.Step enum
+    "C_RC_NA_1": lambda value: c104.StepCmd(c104.Step.HIGHER if int(value) > 0 else c104.Step.LOWER),
+    # Normalized set point command - needs NormalizedFloat wrapper
+    "C_SE_NA_1": lambda value: c104.NormalizedCmd(c104.NormalizedFloat(float(value))),
+    # Scaled set point command - expects Int16 directly as target
+    "C_SE_NB_1": lambda value: c104.ScaledCmd(c104.Int16(int(value))),
+    # Float set point command - ShortCmd expects float directly as target
+    "C_SE_NC_1": lambda value: c104.ShortCmd(float(value)),
+}
+
 class IEC104Client:
     """IEC-104 Client wrapper using c104 library with enhanced error handling"""
     
+    __slots__ = ('host', 'port', 'asdu_address', 'client', 'connection', 'station', 'connected',
+                 '_state', 'points_cache', '_values', '_values_lock', '_subscriptions', 'lock', 'last_used')
+    
     def __init__(self, host: str, port: int = 2404, asdu_address: int = 1):
         self.host = str(host)
         self.port = int(port)
@@ -326,12 +473,26 @@ class IEC104Client:
         self.connection = None
         self.station = None
         self.connected = False
-        self.points_cache = {}  # Cache points by IOA
+        # Connection state, kept current by the c104 state-change callback
+        self._state = c104.ConnectionState.CLOSED
+        # Cache (point, type name) by IOA so type checks don't go through the c104 object
+        self.points_cache: Dict[int, Tuple[c104.Point, str]] = {}
+        # Last information received per IOA, filled by the c104 receive callback
+        self._values: Dict[int, Tuple[Any, float]] = {}
+        self._values_lock = threading.Lock()
+        # One (changed IOAs, wake-up event) pair per poller sharing this client, so every poller
+        # sees every spontaneous report (see subscribe())
+        self._subscriptions: List[Tuple[set, threading.Event]] = []
+        # Serializes changes to the station's points (reads, writes) when the client is shared through the client pool
+        self.lock = threading.Lock()
+        # Monotonic time the client was last handed out by the client pool or, while a poller
+        # holds it, last waited on between scans
+        self.last_used = time.monotonic()
         
     def connect(self) -> Tuple[bool, Optional[Dict]]:
         """Connect to the IEC-104 server with detailed error information"""
         try:
-            if self.connected and self.connection and self.connection.is_connected:
+            if self.connected and self.is_alive:
                 return True, None
                 
             # Add connection to client
@@ -349,6 +510,8 @@ class IEC104Client:
                 logger.error(f"Failed to create IEC-104 connection to {self.host}:{self.port}")
                 return False, error_info
                 
+            self.connection.on_state_change(callable=self._on_state_change)
+            
             # Add station with the specified ASDU address
             self.station = self.connection.add_station(common_address=self.asdu_address)
             
@@ -366,20 +529,21 @@ class IEC104Client:
             # Connect to the server
             self.connection.connect()
             
-            # Wait for connection to establish
-            time.sleep(1.0)
+            # Wait for connection to establish (bounded, returns as soon as it is up)
+            self._wait_until(lambda: self.connection.is_connected, IEC104_CONNECT_TIMEOUT_S)
             
             # Check connection state and provide detailed information
-            connection_state = getattr(self.connection, 'state', 0)
+            connection_state = self._state = self.connection.state
             
             # Check if connected and unmute if needed
             if self.connection.is_connected:
                 if self.connection.is_muted:
                     logger.info(f"IEC-104 connection to {self.host}:{self.port} is muted, unmuting...")
                     self.connection.unmute()
-                    time.sleep(0.5)
+                    self._wait_until(lambda: not self.connection.is_muted, timeout=1.0)
                     
                 self.connected = True
+                self._prefetch_points()
                 logger.info(f"IEC-104 connection to {self.host}:{self.port} successful (state: {connection_state})")
                 return True, None
             else:
@@ -396,17 +560,41 @@ class IEC104Client:
             self.connected = False
             return False, error_info
     
+    def _on_state_change(self, connection: c104.Connection, state: c104.ConnectionState) -> None:
+        """Track connection state changes reported by c104"""
+        self._state = state
+    
+    @property
+    def is_alive(self) -> bool:
+        """Whether the connection is open, without querying the c104 connection object"""
+        return self._state in _OPEN_CONNECTION_STATES
+    
+    @staticmethod
+    def _wait_until(predicate: Callable[[], bool], timeout: float, interval: float = 0.01) -> bool:
+        """Poll predicate until it holds or the timeout expires; returns its final result"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(interval)
+        return predicate()
+    
     def disconnect(self):
         """Disconnect from the IEC-104 server"""
         try:
             if self.connection and self.connected:
                 self.connection.disconnect()
                 self.connected = False
+                self._state = c104.ConnectionState.CLOSED
                 
             if self.client and self.client.is_running:
                 self.client.stop()
                 
             self.points_cache.clear()
+            with self._values_lock:
+                self._values.clear()
+                for changed, _ in self._subscriptions:
+                    changed.clear()
             logger.info(f"Disconnected from IEC-104 server {self.host}:{self.port}")
             
         except Exception as e:
@@ -416,16 +604,17 @@ class IEC104Client:
         """Ensure a point exists for the given IOA and type"""
         # For write operations, always clear cache and recreate point to avoid type conflicts
         if ioa in self.points_cache:
-            cached_point = self.points_cache[ioa]
+            cached_point, cached_type_name = self.points_cache[ioa]
             try:
                 # Check if cached point type matches requested type
-                cached_type_name = str(cached_point.type).split('.')[-1] if hasattr(cached_point, 'type') else None
                 if cached_type_name == type_id:
                     return cached_point
                 else:
                     # Clear cache and remove point if type doesn't match
-                    logger.debug(f"Type mismatch for IOA {ioa}: cached={cached_type_name}, requested={type_id}")
+                    logger.debug("Type mismatch for IOA %s: cached=%s, requested=%s", ioa, cached_type_name, type_id)
                     del self.points_cache[ioa]
+                    with self._values_lock:
+                        self._values.pop(ioa, None)
                     # Try to remove the point from station to force recreation
                     if self.station:
                         try:
@@ -433,55 +622,104 @@ class IEC104Client:
                         except:
                             pass  # Ignore if remove fails
             except Exception as e:
-                logger.debug(f"Error checking cached point type for IOA {ioa}: {e}")
+                logger.debug("Error checking cached point type for IOA %s: %s", ioa, e)
                 # Clear cache on any error
                 del self.points_cache[ioa]
             
-        # Map type_id string to c104 Type enum
-        type_mapping = {
-            "M_SP_NA_1": c104.Type.M_SP_NA_1,
-            "M_DP_NA_1": c104.Type.M_DP_NA_1,
-            "M_ST_NA_1": c104.Type.M_ST_NA_1,
-            "M_ME_NA_1": c104.Type.M_ME_NA_1,
-            "M_ME_NB_1": c104.Type.M_ME_NB_1,
-            "M_ME_NC_1": c104.Type.M_ME_NC_1,
-            "M_IT_NA_1": c104.Type.M_IT_NA_1,
-            "C_SC_NA_1": c104.Type.C_SC_NA_1,
-            "C_DC_NA_1": c104.Type.C_DC_NA_1,
-            "C_RC_NA_1": c104.Type.C_RC_NA_1,
-            "C_SE_NA_1": c104.Type.C_SE_NA_1,
-            "C_SE_NB_1": c104.Type.C_SE_NB_1,
-            "C_SE_NC_1": c104.Type.C_SE_NC_1,
-        }
-        
-        # For write operations, ensure we use command type, not monitoring type
-        c104_type = type_mapping.get(type_id)
-        if not c104_type:
-            # Default based on operation type
-            if type_id.startswith('C_'):
-                c104_type = c104.Type.C_SC_NA_1  # Default command type
-            else:
-                c104_type = c104.Type.M_SP_NA_1  # Default monitoring type
-        
         # First try to get existing point
         point = self.station.get_point(io_address=ioa)
         
         if not point:
             # Add the point if it doesn't exist
-            point = self.station.add_point(io_address=ioa, type=c104_type)
+            return self._add_point_with_type(ioa, type_id)
             
+        if type_id.startswith('M_'):
+            point.on_receive(callable=self._on_receive)
+        self.points_cache[ioa] = (point, point.type.name)
+        return point
+    
+    def _add_point_with_type(self, ioa: int, type_id: str):
+        """Add a point of the c104 type matching type_id to the station and cache it"""
+        c104_type = _TYPE_MAP.get(type_id)
+        if not c104_type:
+            # Default based on operation type
+            c104_type = _DEFAULT_COMMAND_TYPE if type_id.startswith('C_') else _DEFAULT_TYPE
+        
+        point = self.station.add_point(io_address=ioa, type=c104_type)
         if point:
-            self.points_cache[ioa] = point
-            
+            if type_id.startswith('M_'):
+                point.on_receive(callable=self._on_receive)
+            self.points_cache[ioa] = (point, c104_type.name)
         return point
     
+    def _on_receive(self, point: c104.Point, previous_info: c104.Information, message: c104.IncomingMessage) -> c104.ResponseState:
+        """Store monitoring data as it arrives (spontaneous or interrogation responses)"""
+        ioa = point.io_address
+        with self._values_lock:
+            self._values[ioa] = (point.info, time.time())
+            for changed, data_event in self._subscriptions:
+                changed.add(ioa)
+                data_event.set()
+        return c104.ResponseState.SUCCESS
+    
+    def subscribe(self) -> Tuple[set, threading.Event]:
+        """Register a consumer of incoming data (a poller) with its own change set and wake-up event"""
+        subscription = (set(), threading.Event())
+        with self._values_lock:
+            self._subscriptions.append(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: Tuple[set, threading.Event]) -> None:
+        """Stop tracking changes for a subscribe() consumer"""
+        with self._values_lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+    
+    @staticmethod
+    def wait_for_data(subscription: Tuple[set, threading.Event], timeout: float) -> bool:
+        """Block until new monitoring data arrives for the subscriber or the timeout expires"""
+        data_event = subscription[1]
+        arrived = data_event.wait(timeout)
+        if arrived:
+            # Data arriving after this point sets the event again for the next wait
+            data_event.clear()
+        return arrived
+    
+    def take_changed(self, subscription: Tuple[set, threading.Event]) -> Dict[int, Any]:
+        """Latest information of every IOA that reported since the subscriber's last call, clearing its change set"""
+        changed = subscription[0]
+        with self._values_lock:
+            infos = {ioa: self._values[ioa][0] for ioa in changed if ioa in self._values}
+            changed.clear()
+        return infos
+    
+    def _prefetch_points(self):
+        """Cache every point the station already holds (e.g. created by the initial interrogation) in one pass"""
+        for point in self.station.points:
+            ioa = point.io_address
+            if ioa not in self.points_cache:
+                type_name = point.type.name
+                if type_name.startswith('M_'):
+                    point.on_receive(callable=self._on_receive)
+                self.points_cache[ioa] = (point, type_name)
+    
+    def snapshot_all(self) -> Dict[int, Any]:
+        """Latest information received for every reported IOA, collected in one pass"""
+        with self._values_lock:
+            return {ioa: info for ioa, (info, _) in self._values.items()}
+    
+    def unreported(self, ioas) -> set:
+        """IOAs for which no data has arrived since the point was registered"""
+        with self._values_lock:
+            return {ioa for ioa in ioas if ioa not in self._values}
+    
     def _force_recreate_point(self, ioa: int, type_id: str):
         """Force recreation of a point with the specified type, removing any existing point"""
-        logger.debug(f"🔄 Forcing recreation of point IOA={ioa} with type={type_id}")
+        logger.debug("🔄 Forcing recreation of point IOA=%s with type=%s", ioa, type_id)
         try:
             # AGGRESSIVE CLEANUP: Clear from cache and ensure fresh point creation
             if ioa in self.points_cache:
-                logger.debug(f"🗑️ Removing IOA {ioa} from points cache")
+                logger.debug("🗑️ Removing IOA %s from points cache", ioa)
                 del self.points_cache[ioa]
             
             # For write operations, we need to ensure the station has the correct point type
@@ -490,65 +728,109 @@ class IEC104Client:
                     # Get all points and remove any conflicting ones
                     existing_point = self.station.get_point(io_address=ioa)
                     if existing_point:
-                        existing_type = str(existing_point.type).split('.')[-1] if hasattr(existing_point, 'type') else 'unknown'
-                        logger.debug(f"🔍 Found existing point at IOA {ioa}: type={existing_type}, requested={type_id}")
+                        existing_type = existing_point.type.name
+                        logger.debug("🔍 Found existing point at IOA %s: type=%s, requested=%s", ioa, existing_type, type_id)
                         
                         if existing_type != type_id:
-                            logger.warning(f"⚠️ TYPE CONFLICT: IOA {ioa} has type {existing_type}, but {type_id} requested for write")
-                            logger.warning(f"⚠️ This is likely due to polling creating monitoring points vs. write needing command points")
-                            # Since c104 doesn't have a direct remove method, we'll work around it
-                            # by creating a new connection/station instance for writes
-                            logger.debug(f"🔄 Will create fresh point with command type {type_id}")
+                            # Monitoring points are restored by write_point once the command is sent
+                            logger.debug("🔄 IOA %s holds type %s, swapping in command type %s", ioa, existing_type, type_id)
+                        # A pooled client may still hold the point from an earlier read or write
+                        self.station.remove_point(io_address=ioa)
                 except Exception as e:
-                    logger.debug(f"Error checking existing point at IOA {ioa}: {e}")
+                    logger.debug("Error checking existing point at IOA %s: %s", ioa, e)
             
             # Create point with the requested type, bypassing cache
-            type_mapping = {
-                "M_SP_NA_1": c104.Type.M_SP_NA_1,
-                "M_DP_NA_1": c104.Type.M_DP_NA_1,
-                "M_ST_NA_1": c104.Type.M_ST_NA_1,
-                "M_ME_NA_1": c104.Type.M_ME_NA_1,
-                "M_ME_NB_1": c104.Type.M_ME_NB_1,
-                "M_ME_NC_1": c104.Type.M_ME_NC_1,
-                "M_IT_NA_1": c104.Type.M_IT_NA_1,
-                "C_SC_NA_1": c104.Type.C_SC_NA_1,
-                "C_DC_NA_1": c104.Type.C_DC_NA_1,
-                "C_RC_NA_1": c104.Type.C_RC_NA_1,
-                "C_SE_NA_1": c104.Type.C_SE_NA_1,
-                "C_SE_NB_1": c104.Type.C_SE_NB_1,
-                "C_SE_NC_1": c104.Type.C_SE_NC_1,
-            }
-            
-            c104_type = type_mapping.get(type_id, c104.Type.C_SC_NA_1)
-            logger.debug(f"🏗️ Creating fresh point: IOA={ioa}, type={type_id}, c104_type={c104_type}")
-            
-            # Try to add the point with correct type
-            point = self.station.add_point(io_address=ioa, type=c104_type)
+            logger.debug("🏗️ Creating fresh point: IOA=%s, type=%s", ioa, type_id)
+            point = self._add_point_with_type(ioa, type_id)
             if point:
-                logger.debug(f"✅ Successfully created fresh point at IOA {ioa} with type {type_id}")
-                self.points_cache[ioa] = point
+                logger.debug("✅ Successfully created fresh point at IOA %s with type %s", ioa, type_id)
                 return point
             else:
-                logger.error(f"❌ Failed to create point at IOA {ioa} with type {type_id}")
+                logger.error("❌ Failed to create point at IOA %s with type %s", ioa, type_id)
                 return None
             
         except Exception as e:
-            logger.error(f"💥 Error in _force_recreate_point for IOA {ioa}: {e}")
-            import traceback
-            logger.error(f"💥 Stack trace: {traceback.format_exc()}")
+            logger.error("💥 Error in _force_recreate_point for IOA %s: %s", ioa, e)
+            logger.debug("💥 Stack trace for IOA %s", ioa, exc_info=True)
             # Fall back to standard ensure_point
             return self._ensure_point(ioa, type_id)
             
+    def _restore_monitoring_point(self, ioa: int, c104_type: c104.Type):
+        """Replace the command point a write put on a monitored IOA with the monitoring point again,
+        keeping the IOA's received data so readers need no new interrogation"""
+        self.points_cache.pop(ioa, None)
+        try:
+            self.station.remove_point(io_address=ioa)
+        except Exception as e:
+            logger.debug("Error removing command point at IOA %s: %s", ioa, e)
+        # Re-add with the original c104 type, which need not be one _TYPE_MAP knows (e.g. M_ME_TF_1)
+        point = self.station.add_point(io_address=ioa, type=c104_type)
+        if point:
+            point.on_receive(callable=self._on_receive)
+            self.points_cache[ioa] = (point, c104_type.name)
+            
+    def interrogate_all(self, qualifier=c104.Qoi.STATION, wait_for_response=False) -> bool:
+        """Send one General Interrogation for the whole station"""
+        try:
+            return self.connection.interrogation(
+                common_address=self.asdu_address,
+                cause=c104.Cot.ACTIVATION,
+                qualifier=qualifier,
+                wait_for_response=wait_for_response
+            )
+        except Exception as e:
+            logger.debug("Interrogation failed: %s", e)
+            return False
+
+    def read_points(self, requests: List[Tuple[int, str]]) -> List[Tuple[Any, Optional[Dict]]]:
+        """Read several points with at most one General Interrogation.
+        Returns one (value, error) result per (ioa, type_id) request, in order.
+        Takes self.lock while touching the station's points, but not while waiting for responses."""
+        try:
+            pending = None
+            with self.lock:
+                if self.connected and self.station:
+                    for ioa, type_id in requests:
+                        self._ensure_point(ioa, type_id)
+                        
+                    # The connection's initial interrogation (re-sent on every reconnect) and spontaneous
+                    # reports keep points that have already reported up to date
+                    pending = self.unreported(ioa for ioa, _ in requests)
+                    if pending:
+                        self.interrogate_all()
+            if pending:
+                # Wait for the responses, returning as soon as every pending point has reported
+                self._wait_until(lambda: not self.unreported(pending), IEC104_INTERROGATION_WINDOW_S)
+        except Exception as e:
+            logger.debug("Interrogation before reading %s points failed: %s", len(requests), e)
+            
+        # Resolve every point from one snapshot of the received data
+        infos = self.snapshot_all()
+        with self.lock:
+            return [self.read_point_cached(ioa, type_id, infos) for ioa, type_id in requests]
+
+    def read_reported(self, ioa: int, type_id: str = "M_SP_NA_1") -> Optional[Tuple[Any, Optional[Dict]]]:
+        """Read the last data an IOA reported without taking self.lock or touching the station's points.
+        Returns None if the IOA has not reported yet (or is not a monitoring point)."""
+        with self._values_lock:
+            last = self._values.get(ioa)
+        cached = self.points_cache.get(ioa)
+        if last is None or cached is None or cached[1] != type_id:
+            return None
+        return self._info_result(ioa, last[0], cached[1])
+
     def read_point(self, ioa: int, type_id: str = "M_SP_NA_1") -> Tuple[Any, Optional[Dict]]:
-        """Read a single point using c104 library with enhanced error handling"""
+        """Read a single point, interrogating the station only if it has not reported the point yet"""
+        return self.read_points([(ioa, type_id)])[0]
+
+    def read_point_cached(self, ioa: int, type_id: str = "M_SP_NA_1", infos: Optional[Dict[int, Any]] = None) -> Tuple[Any, Optional[Dict]]:
+        """Read the last value received for a point without sending an interrogation.
+        Pass a snapshot_all() result to read many points without a lookup per point."""
+        if not self.connected or not self.station:
+            return None, _ERR_NOT_CONNECTED
+            
+        # Only the c104 calls can raise; everything after works on plain values
         try:
-            if not self.connected or not self.station:
-                error_info = extract_iec104_error_details(
-                    "Client not connected",
-                    connection_state=0  # CLOSED
-                )
-                return None, error_info
-                
             # Ensure point exists
             point = self._ensure_point(ioa, type_id)
             if not point:
@@ -558,78 +840,85 @@ class IEC104Client:
                 )
                 return None, error_info
                 
-            # Trigger interrogation to get fresh data
-            try:
-                self.connection.interrogation(station=self.asdu_address)
-                time.sleep(0.5)  # Wait for response
-            except Exception as interr_e:
-                logger.debug(f"Interrogation failed: {interr_e}")
-                
-            # Read the point value and convert to Python primitive
-            try:
-                info = point.info
-                if info and hasattr(info, 'value'):
-                    # Check quality flags if available
-                    quality_flags = None
-                    if hasattr(info, 'quality'):
-                        quality_flags = getattr(info.quality, 'flags', None)
-                    
-                    # Extract quality issues if present
-                    if quality_flags and (quality_flags & 0xF1):  # Check for error flags
-                        error_info = extract_iec104_error_details(
-                            f"Quality issues detected for point {ioa}",
-                            quality_flags=quality_flags
-                        )
-                        python_value = convert_c104_value_to_python(info, type_id)
-                        return python_value, error_info
-                    
-                    # Convert c104 value to Python primitive for serialization
-                    python_value = convert_c104_value_to_python(info, type_id)
-                    return python_value, None
-                else:
-                    error_info = extract_iec104_error_details(
-                        f"No data available for point {ioa} (type: {type_id})",
-                        cot_code=2  # Object not accessible
-                    )
-                    return None, error_info
-            except Exception as read_e:
-                error_info = extract_iec104_error_details(read_e)
-                return None, error_info
-            
+            # Read the last received information
+            if infos is not None and ioa in infos:
+                info = infos[ioa]
+            else:
+                with self._values_lock:
+                    last = self._values.get(ioa)
+                info = last[0] if last else point.info
         except Exception as e:
             error_info = extract_iec104_error_details(e)
-            logger.error(f"Error reading IEC-104 point {ioa}: {e}")
+            logger.error("Error reading IEC-104 point %s: %s", ioa, e)
             return None, error_info
+            
+        return self._info_result(ioa, info, type_id)
+    
+    def _info_result(self, ioa: int, info, type_id: str) -> Tuple[Any, Optional[Dict]]:
+        """Convert received information to a (value, error) result, reporting missing data and bad quality"""
+        # Quality descriptor bits (c104.Quality converts to the IEC 60870-5-101 bit layout)
+        try:
+            quality_flags = int(info.quality)
+        except (AttributeError, TypeError, ValueError):
+            quality_flags = None
+            
+        if not info or not hasattr(info, 'value'):
+            error_info = extract_iec104_error_details(
+                f"No data available for point {ioa} (type: {type_id})",
+                cot_code=2  # Object not accessible
+            )
+            return None, error_info
+            
+        # Convert c104 value to Python primitive for serialization
+        python_value = convert_c104_value_to_python(info, type_id)
+        
+        # Extract quality issues if present
+        if quality_flags and (quality_flags & 0xF1):  # Check for error flags
+            error_info = extract_iec104_error_details(
+                f"Quality issues detected for point {ioa}",
+                quality_flags=quality_flags
+            )
+            return python_value, error_info
+            
+        return python_value, None
     
     def write_point(self, ioa: int, value: Any, type_id: str = "C_SC_NA_1") -> Tuple[bool, Optional[Dict]]:
         """Write a single point using c104 library with enhanced error handling"""
-        logger.debug(f"🔧 write_point called: IOA={ioa}, value={value}, type_id={type_id}")
+        logger.debug("🔧 write_point called: IOA=%s, value=%s, type_id=%s", ioa, value, type_id)
         try:
             if not self.connected or not self.station:
-                error_info = extract_iec104_error_details(
-                    "Client not connected",
-                    connection_state=0  # CLOSED
-                )
-                return False, error_info
+                return False, _ERR_NOT_CONNECTED
                 
             # Ensure point exists
             # For write operations, convert monitoring types to command types
             if type_id.startswith('M_'):
                 # Map monitoring types to corresponding command types
-                command_type_mapping = {
-                    'M_SP_NA_1': 'C_SC_NA_1',  # Single point -> Single command
-                    'M_DP_NA_1': 'C_DC_NA_1',  # Double point -> Double command
-                    'M_ME_NA_1': 'C_SE_NA_1',  # Measured normalized -> Set normalized
-                    'M_ME_NB_1': 'C_SE_NB_1',  # Measured scaled -> Set scaled
-                    'M_ME_NC_1': 'C_SE_NC_1',  # Measured float -> Set float
-                }
-                command_type_id = command_type_mapping.get(type_id, 'C_SC_NA_1')
+                command_type_id = _READ_TO_WRITE.get(type_id, 'C_SC_NA_1')
+            else:
+                command_type_id = type_id
+                
+            # Resolve the command builder before touching the station's points
+            builder = _CMD_BUILDERS.get(command_type_id)
+            if builder is None:
+                error_info = extract_iec104_error_details(
+                    f"Unsupported command type: {type_id}",
+                    cot_code=44  # UNKNOWN_TYPE_ID
+                )
+                return False, error_info
+                
+            cached = self.points_cache.get(ioa)
+            # A monitored IOA (e.g. one a poller reads) only lends its slot to the command point;
+            # the monitoring point and its received data are put back once the command is sent
+            monitored_type = cached[0].type if cached and cached[1].startswith('M_') else None
+            if cached and cached[1] == command_type_id:
+                # Already a command point of the right type (e.g. a repeated write)
+                point = cached[0]
+            else:
                 # Force recreation to avoid type conflicts
                 point = self._force_recreate_point(ioa, command_type_id)
-            else:
-                # For command types, also force recreation to ensure correct type
-                point = self._force_recreate_point(ioa, type_id)
             if not point:
+                if monitored_type:
+                    self._restore_monitoring_point(ioa, monitored_type)
                 error_info = extract_iec104_error_details(
                     f"Failed to create/get point with IOA {ioa}",
                     cot_code=47  # UNKNOWN_IOA
@@ -639,77 +928,69 @@ class IEC104Client:
             # Create the appropriate command object, set it on point, then transmit
             success = False
             try:
-                if type_id == "C_SC_NA_1":
-                    # Single command - accepts boolean directly with proper string handling
-                    bool_val = convert_to_boolean(value)
-                    logger.debug(f"📤 Creating SingleCmd: IOA={ioa}, bool_value={bool_val}, point_type={point.type if hasattr(point, 'type') else 'unknown'}")
-                    cmd = c104.SingleCmd(bool_val)
-                    logger.debug(f"✅ SingleCmd created successfully: {cmd}")
-                    point.info = cmd
-                    logger.debug(f"✅ Command assigned to point.info")
-                    success = point.transmit(c104.Cot.ACTIVATION)
-                    logger.debug(f"📡 Transmission result: {success}")
-                elif type_id == "C_DC_NA_1":
-                    # Double command - expects c104.Double enum
-                    double_state = c104.Double.ON if convert_to_boolean(value) else c104.Double.OFF
-                    cmd = c104.DoubleCmd(double_state)
-                    point.info = cmd
-                    success = point.transmit(c104.Cot.ACTIVATION)
-                elif type_id == "C_RC_NA_1":
-                    # Step command - expects c104.Step enum
-                    step_dir = c104.Step.HIGHER if int(value) > 0 else c104.Step.LOWER
-                    cmd = c104.StepCmd(step_dir)
-                    point.info = cmd
-                    success = point.transmit(c104.Cot.ACTIVATION)
-                elif type_id == "C_SE_NA_1":
-                    # Normalized set point command - needs NormalizedFloat wrapper
-                    norm_float = c104.NormalizedFloat(float(value))
-                    cmd = c104.NormalizedCmd(norm_float)
-                    point.info = cmd
-                    success = point.transmit(c104.Cot.ACTIVATION)
-                elif type_id == "C_SE_NB_1":
-                    # Scaled set point command - expects Int16 directly as target
-                    int16_val = c104.Int16(int(value))
-                    cmd = c104.ScaledCmd(int16_val)
-                    point.info = cmd
-                    success = point.transmit(c104.Cot.ACTIVATION)
-                elif type_id == "C_SE_NC_1":
-                    # Float set point command - ShortCmd expects float directly as target
-                    cmd = c104.ShortCmd(float(value))
-                    point.info = cmd
-                    success = point.transmit(c104.Cot.ACTIVATION)
-                else:
-                    error_info = extract_iec104_error_details(
-                        f"Unsupported command type: {type_id}",
-                        cot_code=44  # UNKNOWN_TYPE_ID
-                    )
-                    return False, error_info
-                    
+                cmd = builder(value)
+                logger.debug("📤 Created %s command for IOA=%s: %s", command_type_id, ioa, cmd)
+                point.info = cmd
+                success = point.transmit(c104.Cot.ACTIVATION)
+                logger.debug("📡 Transmission result: %s", success)
+                
             except Exception as cmd_e:
-                logger.error(f"💥 Exception in command creation/transmission: {cmd_e}")
-                logger.error(f"💥 Exception type: {type(cmd_e)}")
-                logger.error(f"💥 IOA={ioa}, type_id={type_id}, value={value}")
-                if hasattr(cmd_e, '__traceback__'):
-                    import traceback
-                    logger.error(f"💥 Stack trace: {traceback.format_exc()}")
+                logger.error("💥 Exception in command creation/transmission (%s) for IOA=%s, type_id=%s, value=%s: %s",
+                             type(cmd_e).__name__, ioa, type_id, value, cmd_e)
+                # The stack walk is only formatted when debug logging is enabled
+                logger.debug("💥 Stack trace for IOA %s", ioa, exc_info=True)
                 error_info = extract_iec104_error_details(cmd_e)
                 return False, error_info
+            finally:
+                if monitored_type:
+                    self._restore_monitoring_point(ioa, monitored_type)
                 
             if success:
-                logger.info(f"Successfully sent IEC-104 command to point {ioa}")
+                logger.info("Successfully sent IEC-104 command to point %s", ioa)
                 return True, None
             else:
-                error_info = extract_iec104_error_details(
-                    "Failed to transmit command",
-                    cot_code=6  # Command not permitted
-                )
-                return False, error_info
+                return False, _ERR_TRANSMIT_FAILED
                 
         except Exception as e:
             error_info = extract_iec104_error_details(e)
-            logger.error(f"Error writing IEC-104 point {ioa}: {e}")
+            logger.error("Error writing IEC-104 point %s: %s", ioa, e)
             return False, error_info
 
+class TagSpec(NamedTuple):
+    """Pre-parsed polling tag"""
+    tag_id: str
+    type_id: str
+    ioa: int
+    name: str
+    error: Optional[str]
+
+def build_tag_spec(tag: Dict[str, Any]) -> TagSpec:
+    """Parse a tag's address and resolve its point type"""
+    tag_id = tag.get('id', 'UnknownTagID')
+    tag_address = tag.get('address')
+    tag_name = tag.get('name', f'tag_{tag_address}')
+    
+    if tag_address is None:
+        return TagSpec(tag_id, "", 0, tag_name, NO_ADDRESS_ERROR)
+        
+    # Parse the address to extract type and IOA
+    type_id, ioa, parse_error = parse_iec104_address(str(tag_address))
+    if parse_error:
+        return TagSpec(tag_id, type_id, ioa, tag_name, parse_error)
+        
+    # Use type from address or fall back to tag type or iec104PointType
+    if type_id == "M_SP_NA_1":  # Default from parsing
+        type_id = tag.get('type') or tag.get('iec104PointType', 'M_ME_NA_1')
+    return TagSpec(tag_id, type_id, ioa, tag_name, None)
+
+def _sleep_unless_stopped(thread: threading.Thread, seconds: float):
+    """Sleep for up to `seconds`, returning early once the thread's stop flag is set"""
+    deadline = time.monotonic() + seconds
+    remaining = seconds
+    while remaining > 0 and not getattr(thread, '_stop_requested', False):
+        time.sleep(min(remaining, IEC104_STOP_CHECK_S))
+        remaining = deadline - time.monotonic()
+
 def poll_iec104_device_sync(device_config: Dict[str, Any], tags: List[Dict[str, Any]], scan_time_ms: int = 1000):
     """
     Poll IEC-104 device synchronously using c104 library with enhanced error handling.
@@ -731,159 +1012,318 @@ def poll_iec104_device_sync(device_config: Dict[str, Any], tags: List[Dict[str,
     
     logger.info(f"IEC-104 device '{device_name}': Starting polling to {host}:{port}, ASDU={asdu_address}")
     
-    # Initialize device in global storage (same pattern as DNP3/SNMP)
+    # Initialize device in global storage; tag entries are written by the first scan
     with _latest_polled_values_lock:
-        if device_name not in _latest_polled_values:
-            _latest_polled_values[device_name] = {}
-        for tag in tags:
-            tag_id = tag.get('id', 'UnknownTagID')
-            _latest_polled_values[device_name][tag_id] = {
-                "value": None,
-                "status": "initializing",
-                "error": None,
-                "timestamp": int(time.time()),
-            }
-    
-    # Create client with extracted config
-    client = IEC104Client(host, port, asdu_address)
+        _latest_polled_values.setdefault(device_name, {})
+    
+    # Resolve tag ids, addresses and types once instead of on every scan
+    tag_specs = [build_tag_spec(tag) for tag in tags]
+    # Tags with address problems are reported every scan without being read
+    invalid_tags = [spec for spec in tag_specs if spec.error]
+    invalid_error_details = [extract_iec104_error_details(spec.error) for spec in invalid_tags]
+    readable_tags = [spec for spec in tag_specs if not spec.error]
+    read_requests = [(spec.ioa, spec.type_id) for spec in readable_tags]
+    # Readable tags by IOA, to publish just the tags whose points pushed new data between scans
+    tags_by_ioa: Dict[int, List[TagSpec]] = {}
+    for spec in readable_tags:
+        tags_by_ioa.setdefault(spec.ioa, []).append(spec)
+    
+    # The connection is shared with single-point get/set calls through the client pool
+    client = None
+    # This poller's change set and wake-up event on the pooled client, renewed when the pool replaces the client
+    subscribed_client = None
+    subscription = None
+    # Last good value published per tag; entries whose value is unchanged only get a new timestamp
+    published_good: Dict[str, Any] = {}
+    # (status, timestamp) last persisted per tag, so the last-seen store is written on changes and heartbeats only
+    timestamps_written: Dict[str, Tuple[str, int]] = {}
+    # Whether the address-error entries of invalid_tags are currently published
+    invalid_published = False
+    # Scans run on a fixed monotonic cadence so per-cycle work and early wake-ups don't shift it
+    period = scan_time_ms / 1000.0
+    next_deadline = time.monotonic()
     
     try:
         # Continuous polling loop (same pattern as other protocols)
+        current_thread = threading.current_thread()
         while True:
+            # Check if stop was requested (for graceful shutdown / redeploy)
+            if getattr(current_thread, '_stop_requested', False):
+                logger.info(f"IEC-104 device '{device_name}': Polling stopped by request")
+                break
+                
             try:
-                start_time = time.time()
+                # One wall-clock timestamp per scan; elapsed time uses the monotonic clock
+                cycle_ts = int(time.time())
+                start_time = time.monotonic()
                 
-                connect_success, connect_error = client.connect()
-                if not connect_success:
+                client, connect_error = _get_or_create_client(host, port, asdu_address)
+                if not client:
                     error_msg = connect_error.get('verbose_description', 'Connection failed') if connect_error else 'Connection failed'
-                    logger.error(f"IEC-104 device '{device_name}': Failed to connect to {host}:{port} - {error_msg}")
+                    logger.error("IEC-104 device '%s': Failed to connect to %s:%s - %s", device_name, host, port, error_msg)
                     # Update all tags with connection error
+                    error_values = {
+                        spec.tag_id: {
+                            "value": None,
+                            "status": "error",
+                            "error": error_msg,
+                            "error_details": connect_error,
+                            "timestamp": cycle_ts,
+                        }
+                        for spec in tag_specs
+                    }
                     with _latest_polled_values_lock:
-                        for tag in tags:
-                            tag_id = tag.get('id', 'UnknownTagID')
-                            _latest_polled_values[device_name][tag_id] = {
-                                "value": None,
-                                "status": "error",
-                                "error": error_msg,
-                                "error_details": connect_error,
-                                "timestamp": int(time.time()),
-                            }
-                    time.sleep(scan_time_ms / 1000.0)
+                        _latest_polled_values[device_name].update(error_values)
+                    published_good.clear()
+                    invalid_published = False
+                    next_deadline = time.monotonic() + period
+                    _sleep_unless_stopped(current_thread, period)
                     continue
                     
                 successful_reads = 0
+                # Results are collected locally and published under one lock acquisition
+                new_values = {}
+                unchanged_tag_ids = []
+                timestamp_updates = []
                 
-                for tag in tags:
-                    tag_id = tag.get('id', 'UnknownTagID')
-                    tag_address = tag.get('address')
-                    tag_name = tag.get('name', f'tag_{tag_address}')
-                    
-                    if tag_address is not None:
-                        # Parse the address to extract type and IOA
-                        type_id, ioa, parse_error = parse_iec104_address(str(tag_address))
-                        
-                        if parse_error:
-                            with _latest_polled_values_lock:
-                                _latest_polled_values[device_name][tag_id] = {
-                                    "value": None,
-                                    "status": "error",
-                                    "error": parse_error,
-                                    "error_details": extract_iec104_error_details(parse_error),
-                                    "timestamp": int(time.time()),
-                                }
-                                # Update persistent last successful timestamp
-                                update_last_successful_timestamp(device_name, tag_id, int(time.time()))
-                            logger.warning(f"IEC-104 device '{device_name}': Address parse error for tag '{tag_name}': {parse_error}")
-                            continue
-                            
-                        # Use type from address or fall back to tag type or iec104PointType
-                        if type_id == "M_SP_NA_1":  # Default from parsing
-                            type_id = tag.get('type') or tag.get('iec104PointType', 'M_ME_NA_1')
-                        
-                        logger.debug(f"IEC-104 device '{device_name}': Reading tag '{tag_name}' IOA={ioa}, Type={type_id}")
-                        value, error_info = client.read_point(ioa, type_id)
-                        
-                        with _latest_polled_values_lock:
-                            if error_info:
-                                error_msg = error_info.get('verbose_description', 'Read error')
-                                _latest_polled_values[device_name][tag_id] = {
-                                    "value": value,  # Include value even if there are quality issues
-                                    "status": "error",
-                                    "error": error_msg,
-                                    "error_details": error_info,
-                                    "timestamp": int(time.time()),
-                                }
-                                # Update persistent last successful timestamp
-                                update_last_successful_timestamp(device_name, tag_id, int(time.time()))
-                                logger.warning(f"IEC-104 device '{device_name}': Error reading tag '{tag_name}' (IOA {ioa}): {error_msg}")
-                            else:
-                                # Ensure value is a Python primitive for serialization
-                                safe_value = value
-                                if hasattr(value, '__float__'):
-                                    safe_value = float(value)
-                                elif hasattr(value, '__int__'):
-                                    safe_value = int(value)
-                                elif hasattr(value, '__bool__'):
-                                    safe_value = bool(value)
-                                    
-                                _latest_polled_values[device_name][tag_id] = {
-                                    "value": safe_value,
-                                    "status": "good",
-                                    "error": None,
-                                    "error_details": None,
-                                    "timestamp": int(time.time()),
-                                }
-                                # Update persistent last successful timestamp
-                                update_last_successful_timestamp(device_name, tag_id, int(time.time()))
-                                successful_reads += 1
-                                logger.info(f"IEC-104 device '{device_name}': Successfully read tag '{tag_name}' (IOA {ioa}): {safe_value}")
+                for spec, error_details in zip(invalid_tags, invalid_error_details):
+                    # Address errors never change, so once published their entries only get a new timestamp
+                    if invalid_published:
+                        unchanged_tag_ids.append(spec.tag_id)
+                    else:
+                        new_values[spec.tag_id] = {
+                            "value": None,
+                            "status": "error",
+                            "error": spec.error,
+                            "error_details": error_details,
+                            "timestamp": cycle_ts,
+                        }
+                    if spec.error == NO_ADDRESS_ERROR:
+                        logger.warning("IEC-104 device '%s': Tag '%s' has no address specified", device_name, spec.name)
+                    else:
+                        timestamp_updates.append((spec.tag_id, "error"))
+                        logger.warning("IEC-104 device '%s': Address parse error for tag '%s': %s", device_name, spec.name, spec.error)
+                
+                # Values are pushed by the station; read_points only interrogates for points that have not reported yet
+                if client is not subscribed_client:
+                    if subscribed_client is not None:
+                        subscribed_client.unsubscribe(subscription)
+                    subscription = client.subscribe()
+                    subscribed_client = client
+                # The full scan publishes everything, so earlier change marks are covered by it
+                client.take_changed(subscription)
+                results = client.read_points(read_requests)
+                for (tag_id, type_id, ioa, tag_name, _), (value, error_info) in zip(readable_tags, results):
+                    if error_info:
+                        error_msg = error_info.get('verbose_description', 'Read error')
+                        new_values[tag_id] = {
+                            "value": value,  # Include value even if there are quality issues
+                            "status": "error",
+                            "error": error_msg,
+                            "error_details": error_info,
+                            "timestamp": cycle_ts,
+                        }
+                        published_good.pop(tag_id, None)
+                        timestamp_updates.append((tag_id, "error"))
+                        logger.warning("IEC-104 device '%s': Error reading tag '%s' (IOA %d): %s", device_name, tag_name, ioa, error_msg)
                     else:
-                        error_info = extract_iec104_error_details("No address specified")
-                        with _latest_polled_values_lock:
-                            _latest_polled_values[device_name][tag_id] = {
-                                "value": None,
-                                "status": "error", 
-                                "error": "No address specified",
-                                "error_details": error_info,
-                                "timestamp": int(time.time()),
+                        # read_point_cached already returns a Python primitive
+                        if tag_id in published_good and type(published_good[tag_id]) is type(value) and published_good[tag_id] == value:
+                            unchanged_tag_ids.append(tag_id)
+                        else:
+                            new_values[tag_id] = {
+                                "value": value,
+                                "status": "good",
+                                "error": None,
+                                "error_details": None,
+                                "timestamp": cycle_ts,
                             }
-                        logger.warning(f"IEC-104 device '{device_name}': Tag '{tag_name}' has no address specified")
+                            published_good[tag_id] = value
+                        timestamp_updates.append((tag_id, "good"))
+                        successful_reads += 1
+                        logger.debug("IEC-104 device '%s': Successfully read tag '%s' (IOA %d): %s", device_name, tag_name, ioa, value)
                 
-                elapsed_time = (time.time() - start_time) * 1000
-                logger.info(f"IEC-104 device '{device_name}': Polled {len(tags)} tags ({successful_reads} successful) in {elapsed_time:.1f}ms")
+                with _latest_polled_values_lock:
+                    device_values = _latest_polled_values[device_name]
+                    device_values.update(new_values)
+                    for tag_id in unchanged_tag_ids:
+                        entry = device_values.get(tag_id)
+                        if entry is not None:
+                            entry["timestamp"] = cycle_ts
+                invalid_published = True
+                # Update persistent last successful timestamps on status changes, otherwise once per heartbeat
+                due_tag_ids = []
+                for tag_id, status in timestamp_updates:
+                    written = timestamps_written.get(tag_id)
+                    if written is None or written[0] != status or cycle_ts - written[1] >= IEC104_TIMESTAMP_HEARTBEAT_S:
+                        timestamps_written[tag_id] = (status, cycle_ts)
+                        due_tag_ids.append(tag_id)
+                if due_tag_ids:
+                    update_last_successful_timestamps(device_name, due_tag_ids, cycle_ts)
+                
+                logger.debug("IEC-104 device '%s': Polled %d tags (%d successful) in %.1fms",
+                             device_name, len(tags), successful_reads, (time.monotonic() - start_time) * 1000)
                 
-                # Sleep for the remaining scan time
-                sleep_time = max(0, (scan_time_ms / 1000.0) - (time.time() - start_time))
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Advance to the next scan deadline, restarting the cadence if we fell a whole period behind
+                now = time.monotonic()
+                if now >= next_deadline:
+                    next_deadline += period
+                    if next_deadline <= now:
+                        next_deadline = now + period
+                        
+                # Wait for the next scan deadline, publishing spontaneous data for just the tags
+                # that reported (in short slices so a stop request is noticed promptly)
+                sleep_time = next_deadline - now
+                while sleep_time > 0 and not getattr(current_thread, '_stop_requested', False):
+                    # Keep the pool reaper off a client this poller still holds, however long the scan time
+                    client.last_used = time.monotonic()
+                    if client.wait_for_data(subscription, min(sleep_time, IEC104_STOP_CHECK_S)):
+                        # Let a burst of spontaneous reports settle before publishing them together
+                        time.sleep(min(IEC104_DATA_COALESCE_S, sleep_time))
+                        changed = client.take_changed(subscription)
+                        changed_tags = [spec for ioa in changed for spec in tags_by_ioa.get(ioa, ())]
+                        if changed_tags:
+                            data_ts = int(time.time())
+                            with client.lock:
+                                results = [client.read_point_cached(spec.ioa, spec.type_id, changed) for spec in changed_tags]
+                            new_values = {}
+                            for spec, (value, error_info) in zip(changed_tags, results):
+                                tag_id = spec.tag_id
+                                if error_info:
+                                    new_values[tag_id] = {
+                                        "value": value,
+                                        "status": "error",
+                                        "error": error_info.get('verbose_description', 'Read error'),
+                                        "error_details": error_info,
+                                        "timestamp": data_ts,
+                                    }
+                                    published_good.pop(tag_id, None)
+                                elif not (tag_id in published_good and type(published_good[tag_id]) is type(value) and published_good[tag_id] == value):
+                                    new_values[tag_id] = {
+                                        "value": value,
+                                        "status": "good",
+                                        "error": None,
+                                        "error_details": None,
+                                        "timestamp": data_ts,
+                                    }
+                                    published_good[tag_id] = value
+                            # Timestamps of unchanged tags and the last-seen store are refreshed by the next scan
+                            if new_values:
+                                with _latest_polled_values_lock:
+                                    _latest_polled_values[device_name].update(new_values)
+                    sleep_time = next_deadline - time.monotonic()
                     
             except Exception as e:
                 error_info = extract_iec104_error_details(e)
                 error_msg = error_info.get('verbose_description', str(e))
-                logger.error(f"IEC-104 device '{device_name}': Error during polling cycle: {error_msg}")
+                logger.error("IEC-104 device '%s': Error during polling cycle: %s", device_name, error_msg)
                 # Update all tags with error status
+                error_ts = int(time.time())
+                error_values = {
+                    spec.tag_id: {
+                        "value": None,
+                        "status": "error",
+                        "error": error_msg,
+                        "error_details": error_info,
+                        "timestamp": error_ts,
+                    }
+                    for spec in tag_specs
+                }
                 with _latest_polled_values_lock:
-                    for tag in tags:
-                        tag_id = tag.get('id', 'UnknownTagID')
-                        _latest_polled_values[device_name][tag_id] = {
-                            "value": None,
-                            "status": "error",
-                            "error": error_msg,
-                            "error_details": error_info,
-                            "timestamp": int(time.time()),
-                        }
-                time.sleep(scan_time_ms / 1000.0)
+                    _latest_polled_values[device_name].update(error_values)
+                published_good.clear()
+                invalid_published = False
+                next_deadline = time.monotonic() + period
+                _sleep_unless_stopped(current_thread, period)
                 
     except Exception as e:
         logger.exception(f"IEC-104 device '{device_name}': Exception in polling thread: {e}")
         
     finally:
-        try:
-            client.disconnect()
-        except:
-            pass
+        # The pooled connection stays open for get/set calls; close_iec104_clients() closes it on shutdown
+        if subscribed_client is not None:
+            subscribed_client.unsubscribe(subscription)
         logger.info(f"IEC-104 device '{device_name}': Polling thread stopped")
 
+# Connected clients shared by the pollers and the single-point get/set API calls, keyed by (host, port, asdu)
+_client_pool: Dict[Tuple[str, int, int], IEC104Client] = {}
+_client_pool_lock = threading.Lock()
+# Per-device locks so a slow connect only blocks callers of that device, not the whole pool
+_client_connect_locks: Dict[Tuple[str, int, int], threading.Lock] = {}
+# Background thread closing idle pooled clients, running while the pool is non-empty
+_pool_reaper: Optional[threading.Thread] = None
+
+def _get_or_create_client(host: str, port: int, asdu_address: int) -> Tuple[Optional[IEC104Client], Optional[Dict]]:
+    """Return a connected pooled client for the device, reconnecting it if the link dropped"""
+    key = (str(host), int(port), int(asdu_address))
+    # Fast path without the pool lock: a single dict lookup is atomic, the lock only guards changes
+    client = _client_pool.get(key)
+    if client is not None and client.is_alive:
+        client.last_used = time.monotonic()
+        return client, None
+        
+    with _client_pool_lock:
+        connect_lock = _client_connect_locks.setdefault(key, threading.Lock())
+        
+    with connect_lock:
+        # Another caller may have reconnected the device while we waited
+        with _client_pool_lock:
+            client = _client_pool.get(key)
+            if client is not None:
+                if client.is_alive:
+                    client.last_used = time.monotonic()
+                    return client, None
+                del _client_pool[key]
+        if client is not None:
+            logger.info(f"Pooled IEC-104 connection to {host}:{port} is down, reconnecting")
+            client.disconnect()
+            
+        client = IEC104Client(host, port, asdu_address)
+        connect_success, connect_error = client.connect()
+        if not connect_success:
+            client.disconnect()
+            return None, connect_error
+        with _client_pool_lock:
+            _client_pool[key] = client
+            _start_pool_reaper()
+        return client, None
+
+def _start_pool_reaper():
+    """Start the idle-client reaper if it is not running (caller holds _client_pool_lock)"""
+    global _pool_reaper
+    if _pool_reaper is None:
+        _pool_reaper = threading.Thread(target=_reap_idle_clients, daemon=True, name="iec104-pool-reaper")
+        _pool_reaper.start()
+
+def _reap_idle_clients():
+    """Disconnect pooled clients idle for longer than IEC104_CLIENT_IDLE_TTL_S; exits once the pool is empty.
+    Running pollers refresh last_used while they wait, so only clients left to get/set calls are reaped."""
+    global _pool_reaper
+    while True:
+        time.sleep(IEC104_CLIENT_IDLE_TTL_S / 2)
+        cutoff = time.monotonic() - IEC104_CLIENT_IDLE_TTL_S
+        with _client_pool_lock:
+            idle_keys = [key for key, client in _client_pool.items() if client.last_used < cutoff]
+            idle_clients = [_client_pool.pop(key) for key in idle_keys]
+            pool_empty = not _client_pool
+            if pool_empty:
+                _pool_reaper = None
+                
+        for client in idle_clients:
+            logger.info(f"Closing idle pooled IEC-104 connection to {client.host}:{client.port}")
+            # Let an in-flight read or write finish first
+            with client.lock:
+                client.disconnect()
+        if pool_empty:
+            return
+
+def close_iec104_clients():
+    """Disconnect every pooled IEC-104 client (called on application shutdown)"""
+    with _client_pool_lock:
+        for client in _client_pool.values():
+            client.disconnect()
+        _client_pool.clear()
+
 def iec104_get_with_error(device_config: Dict[str, Any], address: str) -> Tuple[Any, Optional[Dict]]:
     """Get single IEC-104 point value with enhanced error handling using c104 library"""
     # Extract IEC-104 specific configuration
@@ -892,12 +1332,10 @@ def iec104_get_with_error(device_config: Dict[str, Any], address: str) -> Tuple[
     asdu_address = device_config.get('iec104AsduAddress') or device_config.get('asdu_address', 1)
     
     if not host:
-        error_info = extract_iec104_error_details("No host specified in device config (iec104IpAddress or ip)")
-        return None, error_info
+        return None, _ERR_NO_HOST
         
     if not address:
-        error_info = extract_iec104_error_details("No address specified")
-        return None, error_info
+        return None, _ERR_NO_ADDRESS
     
     # Parse the address
     type_id, ioa, parse_error = parse_iec104_address(address)
@@ -905,26 +1343,27 @@ def iec104_get_with_error(device_config: Dict[str, Any], address: str) -> Tuple[
         error_info = extract_iec104_error_details(parse_error)
         return None, error_info
         
-    client = IEC104Client(host, port, asdu_address)
-    
     try:
-        connect_success, connect_error = client.connect()
-        if not connect_success:
+        client, connect_error = _get_or_create_client(host, port, asdu_address)
+        if not client:
             return None, connect_error
             
-        value, error_info = client.read_point(ioa, type_id)
+        if ':' not in address:
+            # A bare IOA reads the point as the type it already has (e.g. one a poller set up)
+            cached = client.points_cache.get(ioa)
+            if cached:
+                type_id = cached[1]
+        # Points already reporting (e.g. polled ones) are served from received data without waiting on the lock
+        result = client.read_reported(ioa, type_id)
+        if result is None:
+            result = client.read_point(ioa, type_id)
+        value, error_info = result
         return value, error_info
         
     except Exception as e:
         error_info = extract_iec104_error_details(e)
-        logger.error(f"Error getting IEC-104 point {address}: {e}")
+        logger.error("Error getting IEC-104 point %s: %s", address, e)
         return None, error_info
-        
-    finally:
-        try:
-            client.disconnect()
-        except:
-            pass
 
 def iec104_set_with_error(device_config: Dict[str, Any], address: str, value: Any, public_address: int = None, point_number: int = None) -> Tuple[bool, Optional[Dict]]:
     """Set single IEC-104 point value with enhanced error handling using c104 library"""
@@ -934,12 +1373,10 @@ def iec104_set_with_error(device_config: Dict[str, Any], address: str, value: An
     asdu_address = device_config.get('iec104AsduAddress') or device_config.get('asdu_address', 1)
     
     if not host:
-        error_info = extract_iec104_error_details("No host specified in device config (iec104IpAddress or ip)")
-        return False, error_info
+        return False, _ERR_NO_HOST
         
     if not address:
-        error_info = extract_iec104_error_details("No address specified")
-        return False, error_info
+        return False, _ERR_NO_ADDRESS
     
     # Parse the address
     type_id, ioa, parse_error = parse_iec104_address(address)
@@ -950,32 +1387,18 @@ def iec104_set_with_error(device_config: Dict[str, Any], address: str, value: An
     # Convert read types to write types
     if type_id.startswith('M_'):
         # Map monitoring types to corresponding command types (same as in write_point)
-        command_type_mapping = {
-            'M_SP_NA_1': 'C_SC_NA_1',  # Single point -> Single command
-            'M_DP_NA_1': 'C_DC_NA_1',  # Double point -> Double command
-            'M_ME_NA_1': 'C_SE_NA_1',  # Measured normalized -> Set normalized
-            'M_ME_NB_1': 'C_SE_NB_1',  # Measured scaled -> Set scaled
-            'M_ME_NC_1': 'C_SE_NC_1',  # Measured float -> Set float
-        }
-        type_id = command_type_mapping.get(type_id, 'C_SC_NA_1')
+        type_id = _READ_TO_WRITE.get(type_id, 'C_SC_NA_1')
         
-    client = IEC104Client(host, port, asdu_address)
-    
     try:
-        connect_success, connect_error = client.connect()
-        if not connect_success:
+        client, connect_error = _get_or_create_client(host, port, asdu_address)
+        if not client:
             return False, connect_error
             
-        success, error_info = client.write_point(ioa, value, type_id)
+        with client.lock:
+            success, error_info = client.write_point(ioa, value, type_id)
         return success, error_info
         
     except Exception as e:
         error_info = extract_iec104_error_details(e)
-        logger.error(f"Error setting IEC-104 point {address}: {e}")
+        logger.error("Error setting IEC-104 point %s: %s", address, e)
         return False, error_info
-        
-    finally:
-        try:
-            client.disconnect()
-        except:
-            pass
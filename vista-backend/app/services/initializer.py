@@ -1,3 +1,4 @@
+import logging
 import threading
 import time
 import os
@@ -49,12 +50,13 @@ def initialize_backend():
             if config:
                 startup_logger.info('✅ Configuration loaded successfully')
                 
-                # Log configuration summary
-                summary = generate_config_summary(config)
-                startup_logger.info('📋 Configuration Summary:')
-                for line in summary.split('\n'):
-                    if line.strip():
-                        startup_logger.info(f'   {line}')
+                # Log configuration summary (walks the whole config, so only when INFO is enabled)
+                if startup_logger.isEnabledFor(logging.INFO):
+                    summary = generate_config_summary(config)
+                    startup_logger.info('📋 Configuration Summary:')
+                    for line in summary.split('\n'):
+                        if line.strip():
+                            startup_logger.info(f'   {line}')
             else:
                 error_logger.error('❌ Failed to load configuration')
                 startup_logger.error('❌ Configuration loading failed - cannot proceed')
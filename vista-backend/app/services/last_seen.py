@@ -50,6 +50,15 @@ def update_last_successful_timestamp(device_name: str, tag_id: str, timestamp: i
     # Persist in background to avoid blocking polling threads
     threading.Thread(target=save_last_successful_timestamps, daemon=True).start()
 
+def update_last_successful_timestamps(device_name: str, tag_ids, timestamp: int) -> None:
+    """Update several tags of a device at once and persist them with a single save."""
+    with _last_successful_timestamps_lock:
+        device_timestamps = _last_successful_timestamps.setdefault(device_name, {})
+        for tag_id in tag_ids:
+            device_timestamps[tag_id] = timestamp
+    # Persist in background to avoid blocking polling threads
+    threading.Thread(target=save_last_successful_timestamps, daemon=True).start()
+
 def get_last_successful_timestamp(device_name: str, tag_id: str):
     """Retrieve the last successful timestamp for a tag, or None if unknown."""
     with _last_successful_timestamps_lock: